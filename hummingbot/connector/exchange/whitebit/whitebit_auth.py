@@ -0,0 +1,104 @@
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict
+from urllib.parse import urlparse
+
+from hummingbot.connector.exchange.whitebit.whitebit_metrics import PHASE_SIGN, add_request_phase
+from hummingbot.connector.time_synchronizer import TimeSynchronizer
+from hummingbot.core.web_assistant.auth import AuthBase
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSRequest
+
+
+class WhitebitAuth(AuthBase):
+    """
+    Long-lived request signer. The keyed HMAC state is built once and copied for every signature, the static headers
+    and the path of each URL are cached, and the request body is encoded only once and reused for the payload.
+    """
+
+    def __init__(self, api_key: str, secret_key: str, time_provider: TimeSynchronizer):
+        self.api_key = api_key
+        self.secret_key = secret_key
+        self.time_provider = time_provider
+        self._hmac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha512)
+        self._static_headers = {
+            "Content-type": "application/json",
+            "X-TXC-APIKEY": api_key,
+        }
+        self._url_paths: Dict[str, str] = {}
+        self._json_encoder = json.JSONEncoder()
+        self._last_nonce = 0
+        self._signing_count = 0
+        self._signing_time = 0.0
+
+    @property
+    def signing_statistics(self) -> Dict[str, float]:
+        """
+        Returns the number of signed requests and the total and average time spent signing them
+        """
+        return {
+            "requests": self._signing_count,
+            "total_time": self._signing_time,
+            "average_time": self._signing_time / self._signing_count if self._signing_count > 0 else 0.0,
+        }
+
+    async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+        """
+        Adds the request path, the nonce and the signature to the request, required for authenticated interactions.
+        It also adds the required parameters in the request header.
+
+        :param request: the request to be configured for authenticated interaction
+        """
+        start_time = time.perf_counter()
+
+        request_data = json.loads(request.data) if request.data is not None else {}
+        request_data["request"] = self._url_path(request.url)
+        request_data["nonce"] = self._nonce()
+        # The body sent to the exchange and the signed payload must be the same string, so it is encoded only once
+        body = self._json_encoder.encode(request_data)
+        request.data = body
+
+        headers = {}
+        if request.headers is not None:
+            headers.update(request.headers)
+        headers.update(self._authentication_headers(body=body))
+        request.headers = headers
+
+        signing_time = time.perf_counter() - start_time
+        self._signing_count += 1
+        self._signing_time += signing_time
+        add_request_phase(phase=PHASE_SIGN, duration=signing_time)
+        return request
+
+    async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+        """
+        This method is intended to configure a websocket request to be authenticated. Whitebit does not use this
+        functionality
+        """
+        return request  # pass-through
+
+    def _url_path(self, url: str) -> str:
+        path = self._url_paths.get(url)
+        if path is None:
+            path = urlparse(url).path
+            self._url_paths[url] = path
+        return path
+
+    def _nonce(self) -> str:
+        # Whitebit rejects a nonce that is not greater than the previous one, which can happen for requests signed in
+        # the same millisecond
+        nonce = max(int(self.time_provider.time() * 1e3), self._last_nonce + 1)
+        self._last_nonce = nonce
+        return str(nonce)
+
+    def _authentication_headers(self, body: str) -> Dict[str, Any]:
+        payload = base64.b64encode(body.encode("utf-8"))
+        signature = self._hmac.copy()
+        signature.update(payload)
+
+        headers = dict(self._static_headers)
+        headers["X-TXC-PAYLOAD"] = payload.decode("utf-8")
+        headers["X-TXC-SIGNATURE"] = signature.hexdigest()
+        return headers
@@ -19,18 +19,32 @@ WHITEBIT_WS_AUTHENTICATION_TOKEN_PATH = "api/v4/profile/websocket_token"
 WHITEBIT_BALANCE_PATH = "api/v4/trade-account/balance"
 WHITEBIT_LIMIT_ORDER_CREATION_PATH = "api/v4/order/new"
 WHITEBIT_MARKET_ORDER_CREATION_PATH = "api/v4/order/market"
+WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH = "api/v4/order/bulk"
 WHITEBIT_ORDER_CANCEL_PATH = "api/v4/order/cancel"
+WHITEBIT_ORDER_CANCEL_ALL_PATH = "api/v4/order/cancel/all"
 WHITEBIT_ACTIVE_ORDER_STATUS_PATH = "api/v4/orders"
 WHITEBIT_EXECUTED_ORDER_STATUS_PATH = "api/v4/trade-account/order/history"
 WHITEBIT_ORDER_TRADES_PATH = "api/v4/trade-account/order"
 
 ORDER_FILLS_REQUEST_INVALID_ORDER_ID_ERROR_CODE = 422
+ORDER_NOT_FOUND_ERROR_CODE = 50005
+ORDER_NOT_FOUND_MESSAGE = "Order not found"
+DUPLICATED_CLIENT_ORDER_ID_MESSAGE = "client order id is already used"
+ACTIVE_ORDERS_REQUEST_LIMIT = 100
+ORDER_HISTORY_REQUEST_LIMIT = 100
+ORDER_FILLS_REQUEST_LIMIT = 100
+ORDER_FILLS_CONCURRENT_PAGES = 3
+BULK_LIMIT_ORDER_MAX_SIZE = 20
+
+MARKETS_CACHE_FILE_NAME = "whitebit_markets_cache.json"
+MARKETS_CACHE_VERSION = 1
 
 # WS endpoints
 WHITEBIT_WS_URI = "wss://api.whitebit.com/ws"
 
 WS_CONNECTION_LIMIT_ID = "WSConnection"
 WS_REQUEST_LIMIT_ID = "WSRequest"
+WHITEBIT_WS_ORDER_BOOK_DEPTH = 100
 WHITEBIT_WS_PUBLIC_BOOKS_CHANNEL = "depth_update"
 WHITEBIT_WS_PUBLIC_TRADES_CHANNEL = "trades_update"
 WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL = "balanceSpot_update"
@@ -42,57 +56,141 @@ NO_LIMIT = sys.maxsize
 MAX_REQUESTS_LIMIT = 10
 WHITEBIT_GENERAL_RATE_LIMIT = "HTTPRequestGlobalLimit"
 
+# Request priority classes, from the most to the least urgent. Each class below cancel has its own lane limit linked
+# to the global one, and can only acquire the global limit while more than its reserved capacity is left, so the last
+# requests of each second are kept for the more urgent classes. Every lane, order book snapshots included, is linked
+# to the global limit, so the total traffic never exceeds the 10 req/s account budget
+REQUEST_PRIORITY_CANCEL = "cancel"
+REQUEST_PRIORITY_CREATE = "create"
+REQUEST_PRIORITY_STATUS = "status"
+REQUEST_PRIORITY_INFO = "info"
+REQUEST_PRIORITY_MARKET_DATA = "market_data"
+REQUEST_PRIORITY_OTHER = "other"
+
+REQUEST_PRIORITY_RESERVED_CAPACITY = {
+    REQUEST_PRIORITY_CANCEL: 0,
+    REQUEST_PRIORITY_CREATE: 1,
+    REQUEST_PRIORITY_STATUS: 3,
+    REQUEST_PRIORITY_INFO: 4,
+    REQUEST_PRIORITY_MARKET_DATA: 4,
+    REQUEST_PRIORITY_OTHER: 4,
+}
+
+CREATE_REQUESTS_LIMIT_ID = "HTTPRequestCreateLane"
+STATUS_REQUESTS_LIMIT_ID = "HTTPRequestStatusLane"
+INFO_REQUESTS_LIMIT_ID = "HTTPRequestInfoLane"
+ORDER_BOOK_REQUESTS_LIMIT_ID = "HTTPRequestOrderBookLane"
+CREATE_REQUESTS_LIMIT = 8
+STATUS_REQUESTS_LIMIT = 5
+INFO_REQUESTS_LIMIT = 2
+ORDER_BOOK_REQUESTS_LIMIT = 2
+
+REQUEST_PRIORITIES = {
+    WHITEBIT_ORDER_CANCEL_PATH: REQUEST_PRIORITY_CANCEL,
+    WHITEBIT_ORDER_CANCEL_ALL_PATH: REQUEST_PRIORITY_CANCEL,
+    WHITEBIT_LIMIT_ORDER_CREATION_PATH: REQUEST_PRIORITY_CREATE,
+    WHITEBIT_MARKET_ORDER_CREATION_PATH: REQUEST_PRIORITY_CREATE,
+    WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH: REQUEST_PRIORITY_CREATE,
+    WHITEBIT_ACTIVE_ORDER_STATUS_PATH: REQUEST_PRIORITY_STATUS,
+    WHITEBIT_EXECUTED_ORDER_STATUS_PATH: REQUEST_PRIORITY_STATUS,
+    WHITEBIT_ORDER_TRADES_PATH: REQUEST_PRIORITY_STATUS,
+    WHITEBIT_BALANCE_PATH: REQUEST_PRIORITY_INFO,
+    WHITEBIT_INSTRUMENTS_PATH: REQUEST_PRIORITY_INFO,
+    WHITEBIT_TICKER_PATH: REQUEST_PRIORITY_INFO,
+    WHITEBIT_ORDER_BOOK_PATH: REQUEST_PRIORITY_MARKET_DATA,
+    WHITEBIT_SERVER_STATUS_PATH: REQUEST_PRIORITY_INFO,
+    WHITEBIT_SERVER_TIME_PATH: REQUEST_PRIORITY_INFO,
+    WHITEBIT_WS_AUTHENTICATION_TOKEN_PATH: REQUEST_PRIORITY_CREATE,
+}
+
 RATE_LIMITS = [
     RateLimit(WS_CONNECTION_LIMIT_ID, limit=100, time_interval=MINUTE),
     RateLimit(WS_REQUEST_LIMIT_ID, limit=NO_LIMIT, time_interval=1),
     RateLimit(WHITEBIT_GENERAL_RATE_LIMIT, limit=MAX_REQUESTS_LIMIT, time_interval=1),
+    RateLimit(CREATE_REQUESTS_LIMIT_ID, limit=CREATE_REQUESTS_LIMIT, time_interval=1),
+    RateLimit(STATUS_REQUESTS_LIMIT_ID, limit=STATUS_REQUESTS_LIMIT, time_interval=1),
+    RateLimit(INFO_REQUESTS_LIMIT_ID, limit=INFO_REQUESTS_LIMIT, time_interval=1),
+    RateLimit(ORDER_BOOK_REQUESTS_LIMIT_ID, limit=ORDER_BOOK_REQUESTS_LIMIT, time_interval=1),
     RateLimit(
         WHITEBIT_SERVER_STATUS_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(INFO_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_SERVER_TIME_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(INFO_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_INSTRUMENTS_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(INFO_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_TICKER_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(INFO_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_ORDER_BOOK_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(ORDER_BOOK_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_BALANCE_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(INFO_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_MARKET_ORDER_CREATION_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(CREATE_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_LIMIT_ORDER_CREATION_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(CREATE_REQUESTS_LIMIT_ID),
+        ],
+    ),
+    RateLimit(
+        WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH,
+        limit=NO_LIMIT,
+        time_interval=1,
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(CREATE_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_ORDER_CANCEL_PATH,
@@ -101,22 +199,37 @@ RATE_LIMITS = [
         linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
     ),
     RateLimit(
-        WHITEBIT_ACTIVE_ORDER_STATUS_PATH,
+        WHITEBIT_ORDER_CANCEL_ALL_PATH,
         limit=NO_LIMIT,
         time_interval=1,
         linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
     ),
+    RateLimit(
+        WHITEBIT_ACTIVE_ORDER_STATUS_PATH,
+        limit=NO_LIMIT,
+        time_interval=1,
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(STATUS_REQUESTS_LIMIT_ID),
+        ],
+    ),
     RateLimit(
         WHITEBIT_EXECUTED_ORDER_STATUS_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(STATUS_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_ORDER_TRADES_PATH,
         limit=NO_LIMIT,
         time_interval=1,
-        linked_limits=[LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT)],
+        linked_limits=[
+            LinkedLimitWeightPair(WHITEBIT_GENERAL_RATE_LIMIT),
+            LinkedLimitWeightPair(STATUS_REQUESTS_LIMIT_ID),
+        ],
     ),
     RateLimit(
         WHITEBIT_WS_AUTHENTICATION_TOKEN_PATH,
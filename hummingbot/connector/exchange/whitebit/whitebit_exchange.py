@@ -1,36 +1,122 @@
 import asyncio
+import json
+import os
+import re
+import time
+from collections import OrderedDict, deque
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
+from async_timeout import timeout
 from bidict import bidict
 
+from hummingbot import data_path
 from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange.whitebit import (
     whitebit_constants as CONSTANTS,
+    whitebit_metrics,
     whitebit_utils as utils,
     whitebit_web_utils as web_utils,
 )
 from hummingbot.connector.exchange.whitebit.whitebit_api_order_book_data_source import WhitebitAPIOrderBookDataSource
-from hummingbot.connector.exchange.whitebit.whitebit_api_user_stream_data_source import WhitebitAPIUserStreamDataSource
 from hummingbot.connector.exchange.whitebit.whitebit_auth import WhitebitAuth
+from hummingbot.connector.exchange.whitebit.whitebit_metrics import WhitebitMetrics
+from hummingbot.connector.exchange.whitebit.whitebit_order_tracker import WhitebitOrderTracker
+from hummingbot.connector.exchange.whitebit.whitebit_sharded_order_book_data_source import (
+    WhitebitShardedAPIOrderBookDataSource,
+)
+from hummingbot.connector.exchange.whitebit.whitebit_throttler import WhitebitThrottler
+from hummingbot.connector.exchange.whitebit.whitebit_tracked_user_stream_data_source import (
+    WhitebitTrackedAPIUserStreamDataSource,
+)
 from hummingbot.connector.exchange_py_base import ExchangePyBase
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import combine_to_hb_trading_pair
+from hummingbot.connector.utils import combine_to_hb_trading_pair, get_new_client_order_id
+from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.event.events import MarketEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
 
+@lru_cache(maxsize=None)
+def _precision_increment(precision: str) -> Decimal:
+    return Decimal(1) / (Decimal(10) ** Decimal(precision))
+
+
 class WhitebitExchange(ExchangePyBase):
     web_utils = web_utils
 
+    # When enabled the status polling fetches the active orders once per market and the order history once, instead
+    # of two requests per tracked order. The fills of an order are then only requested when the executed amount in
+    # those responses changed, and at most BULK_ORDER_STATUS_MAX_INDIVIDUAL_REQUESTS orders missing from both responses
+    # are requested one by one in each cycle
+    BULK_ORDER_STATUS_UPDATE = True
+    BULK_ORDER_STATUS_MAX_INDIVIDUAL_REQUESTS = 5
+    TICKER_CACHE_TTL = 1.0
+    # Number of (exchange order id, trade id) pairs remembered to drop fills received twice (user stream and REST
+    # polling). The order id is part of the key because both orders of a self-match share the same deal id
+    SEEN_TRADE_IDS_MAX_SIZE = 10000
+    # When enabled cancel_all sends one cancel-all request per market. Whitebit then cancels every open order of those
+    # markets, including orders placed manually or by other bots on the same account, so it is opt-in
+    MARKET_WIDE_CANCEL_ALL = False
+    # When enabled the symbol map and the trading rules are loaded from disk at startup, and the markets request only
+    # validates them in the background
+    MARKETS_CACHE_ENABLED = True
+    # Balance refreshes are skipped (and retried in the next polling cycle) when fewer global requests are left
+    BALANCE_UPDATE_MIN_AVAILABLE_REQUESTS = 3
+    # Order status and fills polls are skipped (and retried in the next polling cycle) when fewer are left
+    STATUS_UPDATE_MIN_AVAILABLE_REQUESTS = 2
+    # When enabled, and orjson is installed, REST responses are decoded with orjson instead of the standard decoder
+    FAST_JSON_DECODE = True
+    # User stream messages that fail to be processed are kept (up to this number) for inspection. The listener only
+    # pauses, and briefly, after a run of consecutive failures
+    USER_STREAM_QUARANTINE_MAX_SIZE = 100
+    USER_STREAM_ERROR_BACKOFF_THRESHOLD = 10
+    USER_STREAM_ERROR_BACKOFF = 0.1
+    # A private channel is healthy while the user stream received a message in the last USER_STREAM_HEALTHY_TIMEOUT
+    # seconds, the stream did not resubscribe in the last USER_STREAM_RESUBSCRIPTION_GRACE_PERIOD seconds (events can be
+    # lost during the reconnection), and the orders and balance channels reported the orders placed more than
+    # USER_STREAM_ORDER_EVENT_TIMEOUT seconds ago. The status polling uses LONG_POLL_INTERVAL while all the channels
+    # are healthy and SHORT_POLL_INTERVAL otherwise
+    USER_STREAM_HEALTHY_TIMEOUT = 30.0
+    USER_STREAM_RESUBSCRIPTION_GRACE_PERIOD = 60.0
+    USER_STREAM_ORDER_EVENT_TIMEOUT = 5.0
+    # While the balance channel is healthy (see USER_STREAM_HEALTHY_TIMEOUT above) the REST balance request only runs
+    # every BALANCE_FULL_REFRESH_INTERVAL seconds, as a full refresh
+    BALANCE_FULL_REFRESH_INTERVAL = 120.0
+    # Seconds between the request metrics summaries written to the log
+    METRICS_LOG_INTERVAL = 300.0
+    # When enabled, an order creation request that did not respond after HEDGED_ORDER_PLACEMENT_DELAY seconds is sent a
+    # second time with the same clientOrderId. Whitebit rejects the copy that arrives second as a duplicated client
+    # order id, so only one order can be created, and the first successful response is used
+    HEDGED_ORDER_PLACEMENT = False
+    HEDGED_ORDER_PLACEMENT_DELAY = 0.3
+    # When enabled the balances reported by get_balance and get_available_balance include changes projected locally
+    # from the order events (funds locked when an order is created, released when it is canceled, and exchanged when it
+    # is filled, fees included). The projected changes are kept apart from the balances received from the exchange, and
+    # each one is only dropped once a balance update received (or requested) after it covers it
+    LOCAL_BALANCE_PROJECTION = True
+    # Number of websocket connections the public order book and trade subscriptions are spread across
+    WS_ORDER_BOOK_SHARDS = 1
+
     def __init__(
         self,
         client_config_map: "ClientConfigAdapter",
@@ -43,11 +129,51 @@ class WhitebitExchange(ExchangePyBase):
         self._secret_key = whitebit_secret_key
         self._trading_required = trading_required
         self._trading_pairs = trading_pairs
+        self._authenticator: Optional[WhitebitAuth] = None
+        self._seen_trade_ids: OrderedDict = OrderedDict()
+        self._duplicate_fills_skipped = 0
+        self._order_fills_cursors: Dict[str, int] = {}
+        # Time of the last individual status request of the orders missing from the bulk status responses
+        self._individual_status_request_timestamps: Dict[str, float] = {}
+        self._ticker_cache: Dict[str, Any] = {}
+        self._ticker_cache_timestamp = 0
+        self._ticker_request: Optional[asyncio.Future] = None
+        # Parsed trading rule and raw market information fingerprint, by exchange symbol
+        self._parsed_trading_rules: Dict[str, TradingRule] = {}
+        self._markets_fingerprints: Dict[str, str] = {}
+        self._user_stream_handlers = {
+            CONSTANTS.WHITEBIT_WS_PRIVATE_TRADES_CHANNEL: self._process_trade_message,
+            CONSTANTS.WHITEBIT_WS_PRIVATE_ORDERS_CHANNEL: self._process_order_message,
+            CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL: self._process_balance_message,
+        }
+        self._quarantined_user_stream_messages: deque = deque(maxlen=self.USER_STREAM_QUARANTINE_MAX_SIZE)
+        self._user_stream_consecutive_errors = 0
+        self._user_stream_failed_messages = 0
+        # Every balance change received from the user stream gets a new sequence number, stored for its asset, so a REST
+        # response requested before the change does not overwrite it
+        self._balance_sequence = 0
+        self._balance_sequences: Dict[str, int] = {}
+        self._last_full_balance_update = 0.0
+        self._metrics = WhitebitMetrics()
+        self._last_metrics_log = 0.0
+        self._hedged_placement_stats: Dict[str, int] = {"orders": 0, "hedged": 0, "hedge_won": 0, "original_won": 0}
+        self._user_stream_channel_timestamps: Dict[str, float] = {}
+        self._last_order_placement_timestamp = 0.0
+        # Base amount of each order still locked in the projected balances, by client order id
+        self._projected_locks: Dict[str, Decimal] = {}
+        # Projected balance changes of each asset as (sequence, total delta, available delta)
+        self._projected_balance_deltas: Dict[str, List[Tuple[int, Decimal, Decimal]]] = {}
         super().__init__(client_config_map)
+        if self.MARKETS_CACHE_ENABLED:
+            self._load_markets_cache()
 
     @property
-    def authenticator(self):
-        return WhitebitAuth(api_key=self._api_key, secret_key=self._secret_key, time_provider=self._time_synchronizer)
+    def authenticator(self) -> WhitebitAuth:
+        if self._authenticator is None:
+            self._authenticator = WhitebitAuth(
+                api_key=self._api_key, secret_key=self._secret_key, time_provider=self._time_synchronizer
+            )
+        return self._authenticator
 
     @property
     def name(self) -> str:
@@ -93,6 +219,27 @@ class WhitebitExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def throttler_wait_statistics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the number of requests and the time they waited in the throttler, per request priority class
+        """
+        return self._throttler.wait_statistics
+
+    @property
+    def signing_statistics(self) -> Dict[str, float]:
+        """
+        Returns the number of signed requests and the time spent signing them
+        """
+        return self.authenticator.signing_statistics
+
+    @property
+    def duplicate_fills_skipped(self) -> int:
+        """
+        Returns the number of fills dropped because the same trade was already processed
+        """
+        return self._duplicate_fills_skipped
+
     async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
         """
         Return a dictionary the trading_pair as key and the current price as value for each trading pair passed as
@@ -103,34 +250,90 @@ class WhitebitExchange(ExchangePyBase):
         :return: Dictionary of associations between token pair and its latest price
         """
         last_prices = {}
-        response = await self._api_get(path_url=CONSTANTS.WHITEBIT_TICKER_PATH)
-        for market_symbol, ticker_info in response.items():
-            trading_pair = await self.trading_pair_associated_to_exchange_symbol(symbol=market_symbol)
-            if trading_pair in trading_pairs:
+        ticker = await self._get_ticker()
+        symbol_map = await self.trading_pair_symbol_map()
+        for trading_pair in trading_pairs:
+            ticker_info = ticker.get(symbol_map.inverse.get(trading_pair))
+            if ticker_info is not None:
                 last_prices[trading_pair] = float(ticker_info["last_price"])
 
         return last_prices
 
+    async def _get_ticker(self) -> Dict[str, Any]:
+        """
+        Returns the ticker of all markets. The response is cached for TICKER_CACHE_TTL seconds, and callers arriving
+        while the request is in flight wait for the same request instead of sending a new one.
+        """
+        if self._time() - self._ticker_cache_timestamp < self.TICKER_CACHE_TTL:
+            return self._ticker_cache
+
+        if self._ticker_request is None or self._ticker_request.done():
+            self._ticker_request = asyncio.ensure_future(self._api_get(path_url=CONSTANTS.WHITEBIT_TICKER_PATH))
+        request = self._ticker_request
+        # Shielded so a cancelled caller does not cancel the request for the rest of them
+        response = await asyncio.shield(request)
+        if request is self._ticker_request:
+            self._ticker_cache = response
+            self._ticker_cache_timestamp = self._time()
+        return response
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
 
+    def restore_tracking_states(self, saved_states: Dict[str, Any]):
+        super().restore_tracking_states(saved_states=saved_states)
+        for order in self.in_flight_orders.values():
+            self._index_order(order=order)
+
+    def _create_order_tracker(self) -> WhitebitOrderTracker:
+        return WhitebitOrderTracker(connector=self)
+
+    def _index_order(self, order: InFlightOrder):
+        self._order_tracker.index_order(order=order)
+
+    def _fetch_indexed_order(self, client_order_id: str, exchange_order_id: str) -> Optional[InFlightOrder]:
+        return self._order_tracker.fetch_order(client_order_id=client_order_id, exchange_order_id=exchange_order_id)
+
+    def _is_duplicate_trade(self, exchange_order_id: str, trade_id: str) -> bool:
+        trade_key = (exchange_order_id, trade_id)
+        if trade_key in self._seen_trade_ids:
+            self._seen_trade_ids.move_to_end(trade_key)
+            self._duplicate_fills_skipped += 1
+            return True
+        return False
+
+    def _register_seen_trade(self, exchange_order_id: str, trade_id: str):
+        self._seen_trade_ids[(exchange_order_id, trade_id)] = None
+        if len(self._seen_trade_ids) > self.SEEN_TRADE_IDS_MAX_SIZE:
+            self._seen_trade_ids.popitem(last=False)
+
+    async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
+        self._last_order_placement_timestamp = self._time()
+        exchange_order_id = await super()._place_order_and_process_update(order, **kwargs)
+        self._index_order(order=order)
+        return exchange_order_id
+
     def _is_request_exception_related_to_time_synchronizer(self, request_exception: Exception):
         # Not required for this connectors
         return False
 
     def _is_order_not_found_during_status_update_error(self, status_update_exception: Exception) -> bool:
-        # TODO: implement this method correctly for the connector
-        # The default implementation was added when the functionality to detect not found orders was introduced in the
-        # ExchangePyBase class. Also fix the unit test test_lost_order_removed_if_not_found_during_order_status_update
-        # when replacing the dummy implementation
-        return False
+        return self._is_order_not_found_error(exception=status_update_exception)
 
     def _is_order_not_found_during_cancelation_error(self, cancelation_exception: Exception) -> bool:
-        # TODO: implement this method correctly for the connector
-        # The default implementation was added when the functionality to detect not found orders was introduced in the
-        # ExchangePyBase class. Also fix the unit test test_cancel_order_not_found_in_the_exchange when replacing the
-        # dummy implementation
-        return False
+        return self._is_order_not_found_error(exception=cancelation_exception)
+
+    def _is_order_not_found_error(self, exception: Exception) -> bool:
+        # Whitebit reports an unknown order either with the error code 50005, or as a validation error (HTTP 422) of the
+        # orderId field. Other validation errors (HTTP 422 too) must not be taken as a missing order. The error can be
+        # the raw JSON response or the repr of the decoded dict, so both quote styles are accepted
+        error_description = str(exception)
+        return (
+            re.search(rf"[\"']code[\"']\s*:\s*{CONSTANTS.ORDER_NOT_FOUND_ERROR_CODE}\b", error_description) is not None
+            or re.search(
+                rf"[\"']orderId[\"']\s*:\s*\[[^\]]*{CONSTANTS.ORDER_NOT_FOUND_MESSAGE}", error_description
+            ) is not None
+        )
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         exchange_order_id = await tracked_order.get_exchange_order_id()
@@ -151,6 +354,106 @@ class WhitebitExchange(ExchangePyBase):
 
         return True
 
+    async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
+        if not self.MARKET_WIDE_CANCEL_ALL:
+            return await super().cancel_all(timeout_seconds=timeout_seconds)
+
+        incomplete_orders = [order for order in self.in_flight_orders.values() if not order.is_done]
+        order_id_set = set([order.client_order_id for order in incomplete_orders])
+        successful_cancellations = []
+
+        try:
+            async with timeout(timeout_seconds):
+                markets_results = await safe_gather(
+                    *[self.cancel_all_for_market(trading_pair=trading_pair)
+                      for trading_pair in set([order.trading_pair for order in incomplete_orders])],
+                    return_exceptions=True,
+                )
+                for market_results in markets_results:
+                    if isinstance(market_results, Exception):
+                        continue
+                    for cancellation_result in market_results:
+                        if cancellation_result.success and cancellation_result.order_id in order_id_set:
+                            order_id_set.remove(cancellation_result.order_id)
+                            successful_cancellations.append(cancellation_result)
+        except Exception:
+            self.logger().network(
+                "Unexpected error cancelling orders.",
+                exc_info=True,
+                app_warning_msg="Failed to cancel order. Check API key and network connection.",
+            )
+
+        failed_cancellations = [CancellationResult(order_id, False) for order_id in order_id_set]
+        return successful_cancellations + failed_cancellations
+
+    async def cancel_all_for_market(self, trading_pair: str) -> List[CancellationResult]:
+        """
+        Cancels all the open orders of a market with a single request, and reconciles every tracked order of the
+        market from that response. Orders still waiting for their exchange order id can not be covered by the
+        market-wide cancelation, and are canceled individually.
+
+        :param trading_pair: the market to cancel the orders for
+
+        :return: the cancellation result of each tracked order of the market
+        """
+        market_orders = [order for order in self.in_flight_orders.values()
+                         if order.trading_pair == trading_pair and not order.is_done]
+        created_orders = [order for order in market_orders if order.exchange_order_id is not None]
+        pending_orders = [order for order in market_orders if order.exchange_order_id is None]
+
+        cancellation_results = []
+        if len(created_orders) > 0:
+            try:
+                cancel_result = await self._api_post(
+                    path_url=CONSTANTS.WHITEBIT_ORDER_CANCEL_ALL_PATH,
+                    data={"market": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)},
+                    is_auth_required=True,
+                    limit_id=CONSTANTS.WHITEBIT_ORDER_CANCEL_ALL_PATH,
+                )
+                if isinstance(cancel_result, dict) and len(cancel_result.get("errors", {})) > 0:
+                    raise IOError(f"Error canceling the orders of {trading_pair} ({cancel_result})")
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Error canceling all the orders of {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg="Failed to cancel orders. Check API key and network connection.",
+                )
+                cancellation_results.extend(
+                    [CancellationResult(order.client_order_id, False) for order in created_orders]
+                )
+            else:
+                for order in created_orders:
+                    if order.is_done:
+                        # Filled (or canceled) while the request was in flight
+                        cancellation_results.append(CancellationResult(order.client_order_id, order.is_cancelled))
+                        continue
+                    # An order filled right before the cancel-all request is reported as canceled here. Canceled orders
+                    # remain fillable in the order tracker, so the fill is still applied when the next fills poll (or
+                    # the user stream) reports it
+                    order_update = OrderUpdate(
+                        client_order_id=order.client_order_id,
+                        trading_pair=trading_pair,
+                        update_timestamp=self.current_timestamp,
+                        new_state=OrderState.CANCELED,
+                    )
+                    self._order_tracker.process_order_update(order_update)
+                    cancellation_results.append(CancellationResult(order.client_order_id, True))
+
+        if len(pending_orders) > 0:
+            canceled_order_ids = await safe_gather(
+                *[self._execute_cancel(trading_pair=trading_pair, order_id=order.client_order_id)
+                  for order in pending_orders],
+                return_exceptions=True,
+            )
+            for order, canceled_order_id in zip(pending_orders, canceled_order_ids):
+                cancellation_results.append(
+                    CancellationResult(order.client_order_id, canceled_order_id == order.client_order_id)
+                )
+
+        return cancellation_results
+
     async def _place_order(
         self,
         order_id: str,
@@ -161,6 +464,123 @@ class WhitebitExchange(ExchangePyBase):
         price: Decimal,
         **kwargs,
     ) -> Tuple[str, float]:
+        data = await self._order_request_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        if order_type != OrderType.MARKET:
+            path_url = CONSTANTS.WHITEBIT_LIMIT_ORDER_CREATION_PATH
+        else:
+            path_url = CONSTANTS.WHITEBIT_MARKET_ORDER_CREATION_PATH
+
+        if self.HEDGED_ORDER_PLACEMENT:
+            response = await self._hedged_order_post(path_url=path_url, data=data)
+        else:
+            response = await self._api_post(path_url=path_url, data=data, is_auth_required=True, limit_id=path_url)
+
+        return str(response["orderId"]), response.get("timestamp", self.current_timestamp)
+
+    @property
+    def hedged_placement_statistics(self) -> Dict[str, int]:
+        """
+        Returns the number of orders placed in hedged mode, how many of them needed the second request, and which of
+        the two requests provided the response
+        """
+        return dict(self._hedged_placement_stats)
+
+    async def _hedged_order_post(self, path_url: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        self._hedged_placement_stats["orders"] += 1
+        original_request = asyncio.ensure_future(
+            self._api_post(path_url=path_url, data=dict(data), is_auth_required=True, limit_id=path_url)
+        )
+        hedge_request = None
+        pending = {original_request}
+        errors = []
+        try:
+            done, pending = await asyncio.wait(pending, timeout=self.HEDGED_ORDER_PLACEMENT_DELAY)
+            if done:
+                return original_request.result()
+
+            self._hedged_placement_stats["hedged"] += 1
+            hedge_request = asyncio.ensure_future(
+                self._api_post(path_url=path_url, data=dict(data), is_auth_required=True, limit_id=path_url)
+            )
+            pending = {original_request, hedge_request}
+            while len(pending) > 0:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for request in done:
+                    if request.exception() is None:
+                        self._hedged_placement_stats["hedge_won" if request is hedge_request else "original_won"] += 1
+                        for pending_request in pending:
+                            pending_request.add_done_callback(self._discard_hedged_request_result)
+                        return request.result()
+                    errors.append(request.exception())
+        except asyncio.CancelledError:
+            for pending_request in pending:
+                pending_request.cancel()
+            raise
+
+        if any(self._is_duplicated_client_order_id_error(error) for error in errors):
+            # The duplicated client order id rejection proves that the other request created the order, even if its
+            # own response was lost, so the order is looked up by its client order id
+            order_data = await self._request_order_by_client_order_id(
+                symbol=data["market"], client_order_id=data["clientOrderId"]
+            )
+            if order_data is not None:
+                return order_data
+        raise next((error for error in errors if not self._is_duplicated_client_order_id_error(error)), errors[0])
+
+    async def _request_order_by_client_order_id(self, symbol: str, client_order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks the order up in the active orders and then in the orders history
+
+        :return: the order id and timestamp in the format of the order creation response, or None if it is not found
+        """
+        active_orders = await self._api_post(
+            path_url=CONSTANTS.WHITEBIT_ACTIVE_ORDER_STATUS_PATH,
+            data={"market": symbol, "clientOrderId": client_order_id},
+            is_auth_required=True,
+        )
+        if isinstance(active_orders, dict):
+            active_orders = [active_orders]
+        if len(active_orders) > 0:
+            order_data = active_orders[0]
+            return {"orderId": order_data["orderId"], "timestamp": order_data.get("timestamp", self.current_timestamp)}
+
+        executed_orders = await self._api_post(
+            path_url=CONSTANTS.WHITEBIT_EXECUTED_ORDER_STATUS_PATH,
+            data={"market": symbol, "clientOrderId": client_order_id},
+            is_auth_required=True,
+        )
+        # If no order is found the result is an empty list. Otherwise, it is a dictionary keyed by market
+        if len(executed_orders) > 0 and len(executed_orders.get(symbol, [])) > 0:
+            order_data = executed_orders[symbol][0]
+            return {"orderId": order_data["id"], "timestamp": order_data.get("ctime", self.current_timestamp)}
+        return None
+
+    @staticmethod
+    def _discard_hedged_request_result(request: asyncio.Future):
+        if not request.cancelled():
+            request.exception()
+
+    @staticmethod
+    def _is_duplicated_client_order_id_error(exception: Exception) -> bool:
+        return CONSTANTS.DUPLICATED_CLIENT_ORDER_ID_MESSAGE in str(exception).lower()
+
+    async def _order_request_data(
+        self,
+        order_id: str,
+        trading_pair: str,
+        amount: Decimal,
+        trade_type: TradeType,
+        order_type: OrderType,
+        price: Decimal,
+    ) -> Dict[str, Any]:
         data = {
             "market": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
             "side": trade_type.name.lower(),
@@ -176,24 +596,126 @@ class WhitebitExchange(ExchangePyBase):
 
         # Указываем тип ордера в зависимости от order_type
         data["type"] = "market" if order_type == OrderType.MARKET else "limit"
-        
-        if order_type != OrderType.MARKET:
-            response = await self._api_post(
-                path_url=CONSTANTS.WHITEBIT_LIMIT_ORDER_CREATION_PATH,
-                data=data,
-                is_auth_required=True,
-                limit_id=CONSTANTS.WHITEBIT_LIMIT_ORDER_CREATION_PATH,
+
+        return data
+
+    def batch_order_create(
+        self,
+        orders_to_create: List[LimitOrder],
+        order_type: OrderType = OrderType.LIMIT,
+    ) -> List[LimitOrder]:
+        """
+        Creates the limit orders using the exchange bulk order endpoint, with one request for each
+        CONSTANTS.BULK_LIMIT_ORDER_MAX_SIZE orders. Every order is tracked as an InFlightOrder before the request is
+        sent, and is then updated individually with the result the exchange returned for it.
+
+        :param orders_to_create: the limit orders to create. Their order ids can be blank
+        :param order_type: OrderType.LIMIT or OrderType.LIMIT_MAKER, applied to all the orders
+
+        :return: the limit orders with the client order ids assigned to them
+        """
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
             )
-        else:
-            response = await self._api_post(
-                path_url=CONSTANTS.WHITEBIT_MARKET_ORDER_CREATION_PATH,
-                data=data,
-                is_auth_required=True,
-                limit_id=CONSTANTS.WHITEBIT_MARKET_ORDER_CREATION_PATH,
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(
+            self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create, order_type=order_type)
+        )
+        return orders_with_ids_to_create
+
+    async def _execute_batch_order_create(self, orders_to_create: List[LimitOrder], order_type: OrderType):
+        orders_to_place = []
+        for order in orders_to_create:
+            trade_type = TradeType.BUY if order.is_buy else TradeType.SELL
+            price = self.quantize_order_price(order.trading_pair, order.price)
+            amount = self.quantize_order_amount(order.trading_pair, order.quantity)
+            self.start_tracking_order(
+                order_id=order.client_order_id,
+                exchange_order_id=None,
+                trading_pair=order.trading_pair,
+                trade_type=trade_type,
+                price=price,
+                amount=amount,
+                order_type=order_type,
             )
+            trading_rule = self._trading_rules.get(order.trading_pair)
+            if trading_rule is None:
+                self.logger().warning(
+                    f"There is no trading rule for {order.trading_pair}. "
+                    f"The order {order.client_order_id} will not be created."
+                )
+                self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+                continue
+            if amount < trading_rule.min_order_size:
+                self.logger().warning(
+                    f"Buy/sell order amount {amount} is lower than the minimum order size for {order.trading_pair}. "
+                    f"The order {order.client_order_id} will not be created."
+                )
+                self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+                continue
+            order_data = await self._order_request_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=price,
+            )
+            # The bulk endpoint only creates limit orders and does not accept the order type field
+            order_data.pop("type")
+            orders_to_place.append((order, order_data))
 
+        for batch_start in range(0, len(orders_to_place), CONSTANTS.BULK_LIMIT_ORDER_MAX_SIZE):
+            batch = orders_to_place[batch_start:batch_start + CONSTANTS.BULK_LIMIT_ORDER_MAX_SIZE]
+            await self._place_bulk_limit_orders(orders=batch)
 
-        return str(response["orderId"]), response.get("timestamp", self.current_timestamp)
+    async def _place_bulk_limit_orders(self, orders: List[Tuple[LimitOrder, Dict[str, Any]]]):
+        self._last_order_placement_timestamp = self._time()
+        try:
+            results = await self._api_post(
+                path_url=CONSTANTS.WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH,
+                data={"orders": [order_data for _, order_data in orders], "stopOnFail": False},
+                is_auth_required=True,
+                limit_id=CONSTANTS.WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH,
+            )
+            # The exchange returns one result per order, in the same order they were sent. Any other payload (e.g. an
+            # error dict for the whole request) leaves the result of each order unknown
+            if not isinstance(results, list) or len(results) != len(orders):
+                raise IOError(f"Unexpected bulk limit orders response ({results})")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                "Error submitting the bulk limit orders request to Whitebit.",
+                exc_info=True,
+                app_warning_msg="Failed to submit the bulk limit orders. Check API key and network connection.",
+            )
+            results = [{"result": None, "error": {"message": "Bulk request failed"}} for _ in orders]
+
+        for (order, _), order_result in zip(orders, results):
+            created_order = order_result.get("result") if isinstance(order_result, dict) else None
+            if not isinstance(order_result, dict) or order_result.get("error") is not None or created_order is None:
+                self.logger().warning(
+                    f"Error creating the order {order.client_order_id} in the bulk request ({order_result})."
+                )
+                self._update_order_after_failure(order_id=order.client_order_id, trading_pair=order.trading_pair)
+            else:
+                order_update = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(created_order["orderId"]),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=float(created_order.get("timestamp", self.current_timestamp)),
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+                tracked_order = self._order_tracker.fetch_tracked_order(client_order_id=order.client_order_id)
+                if tracked_order is not None:
+                    self._index_order(order=tracked_order)
 
     def _get_fee(
         self,
@@ -221,113 +743,379 @@ class WhitebitExchange(ExchangePyBase):
     async def _update_trading_fees(self):
         pass
 
+    @property
+    def quarantined_user_stream_messages(self) -> List[Dict[str, Any]]:
+        """
+        Returns the latest user stream messages that could not be processed, with the time and the error
+        """
+        return list(self._quarantined_user_stream_messages)
+
+    @property
+    def user_stream_failed_messages(self) -> int:
+        return self._user_stream_failed_messages
+
+    @property
+    def user_stream_channels_freshness(self) -> Dict[str, Optional[float]]:
+        """
+        Returns the seconds since the last event of each private channel (None if the channel had no events yet)
+        """
+        now = self._time()
+        return {
+            channel: now - self._user_stream_channel_timestamps[channel]
+            if channel in self._user_stream_channel_timestamps else None
+            for channel in self._user_stream_handlers
+        }
+
+    def tick(self, timestamp: float):
+        poll_interval = (
+            self.LONG_POLL_INTERVAL
+            if all(self._is_user_stream_channel_healthy(channel=channel) for channel in self._user_stream_handlers)
+            else self.SHORT_POLL_INTERVAL
+        )
+        last_tick = int(self._last_timestamp / poll_interval)
+        current_tick = int(timestamp / poll_interval)
+        if current_tick > last_tick:
+            self._poll_notifier.set()
+        self._last_timestamp = timestamp
+
+    def _is_user_stream_channel_healthy(self, channel: str) -> bool:
+        now = self._time()
+        if now - self._user_stream_tracker.last_recv_time > self.USER_STREAM_HEALTHY_TIMEOUT:
+            return False
+        # The data source resubscribes the private channels each time it reconnects
+        last_subscription_timestamp = self._user_stream_tracker.data_source.last_subscription_timestamp
+        if now - last_subscription_timestamp < self.USER_STREAM_RESUBSCRIPTION_GRACE_PERIOD:
+            return False
+        if channel in (CONSTANTS.WHITEBIT_WS_PRIVATE_ORDERS_CHANNEL, CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL):
+            # Every order placement produces an event in these channels
+            channel_timestamp = self._user_stream_channel_timestamps.get(channel, 0.0)
+            return (
+                channel_timestamp >= self._last_order_placement_timestamp
+                or now - self._last_order_placement_timestamp < self.USER_STREAM_ORDER_EVENT_TIMEOUT
+            )
+        return True
+
     async def _user_stream_event_listener(self):
         async for stream_message in self._iter_user_event_queue():
             try:
                 channel = stream_message.get("method")
-
-                if channel == CONSTANTS.WHITEBIT_WS_PRIVATE_TRADES_CHANNEL:
-                    event_message = {
-                        "time": stream_message["params"][1],
-                        "fee": stream_message["params"][6],
-                        "price": stream_message["params"][4],
-                        "amount": stream_message["params"][5],
-                        "id": stream_message["params"][0],
-                        "dealOrderId": stream_message["params"][3],
-                        "clientOrderId": stream_message["params"][7],
-                    }
-                    event_message["deal"] = str(
-                        Decimal(str(event_message["amount"])) * Decimal(str(event_message["price"]))
-                    )
-
-                    order = self._order_tracker.all_fillable_orders.get(event_message["clientOrderId"])
-                    if order is not None:
-                        trade_update = self._create_trade_update(trade_msg=event_message, order=order)
-                        self._order_tracker.process_trade_update(trade_update)
-
-                elif channel == CONSTANTS.WHITEBIT_WS_PRIVATE_ORDERS_CHANNEL:
-                    update_event_id, event_message = stream_message["params"]
-                    executed_amount = Decimal(str(event_message["deal_stock"]))
-
-                    if update_event_id in [1, 2]:
-                        order_state = OrderState.OPEN
-                    elif update_event_id == 3 and executed_amount == s_decimal_0:
-                        order_state = OrderState.CANCELED
-                    else:
-                        order_state = OrderState.FILLED
-
-                    event_message["order_state"] = order_state
-                    client_order_id = str(event_message.get("clientOrderId", event_message.get("client_order_id")))
-                    order = self._order_tracker.all_updatable_orders.get(client_order_id)
-                    if order is not None:
-                        order_update = self._create_order_update(order_msg=event_message, order=order)
-                        self._order_tracker.process_order_update(order_update)
-
-                elif channel == CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL:
-                    for data in stream_message.get("params", []):
-                        for token, balance_info in data.items():
-                            available = Decimal(str(balance_info["available"]))
-                            frozen = Decimal(str(balance_info["freeze"]))
-                            self._account_balances[token] = available + frozen
-                            self._account_available_balances[token] = available
-
+                handler = self._user_stream_handlers.get(channel)
+                if handler is not None:
+                    self._user_stream_channel_timestamps[channel] = self._time()
+                    handler(stream_message["params"])
+                self._user_stream_consecutive_errors = 0
             except asyncio.CancelledError:
                 raise
+            except Exception as exception:
+                self._quarantine_user_stream_message(stream_message=stream_message, exception=exception)
+                if self._user_stream_consecutive_errors >= self.USER_STREAM_ERROR_BACKOFF_THRESHOLD:
+                    await self._sleep(self.USER_STREAM_ERROR_BACKOFF)
+
+    def _quarantine_user_stream_message(self, stream_message: Any, exception: Exception):
+        self._user_stream_consecutive_errors += 1
+        self._user_stream_failed_messages += 1
+        self._quarantined_user_stream_messages.append(
+            {"timestamp": self._time(), "message": stream_message, "error": repr(exception)}
+        )
+        # Only the first failure of a run is logged with its traceback, to keep a burst of bad messages from flooding
+        # the logs
+        if self._user_stream_consecutive_errors == 1:
+            self.logger().exception("Unexpected error processing a user stream message. The message was quarantined.")
+        else:
+            self.logger().debug(f"Quarantined user stream message {stream_message} ({exception!r})")
+
+    def _process_trade_message(self, params: List[Any]):
+        trade_id = str(params[0])
+        exchange_order_id = str(params[3])
+        if self._is_duplicate_trade(exchange_order_id=exchange_order_id, trade_id=trade_id):
+            return
+        order = self._fetch_indexed_order(client_order_id=str(params[7]), exchange_order_id=exchange_order_id)
+        if order is not None:
+            trade_update = self._build_trade_update(
+                trade_id=trade_id,
+                order=order,
+                price=Decimal(str(params[4])),
+                amount=Decimal(str(params[5])),
+                fee_amount=Decimal(str(params[6])),
+                timestamp=float(params[1]),
+            )
+            self._order_tracker.process_trade_update(trade_update)
+            self._register_seen_trade(exchange_order_id=exchange_order_id, trade_id=trade_id)
+
+    def _process_order_message(self, params: List[Any]):
+        update_event_id, event_message = params
+        client_order_id = str(event_message.get("clientOrderId", event_message.get("client_order_id")))
+        order = self._fetch_indexed_order(client_order_id=client_order_id, exchange_order_id=str(event_message["id"]))
+        if order is not None:
+            if update_event_id in [1, 2]:
+                order_state = OrderState.OPEN
+            elif update_event_id == 3 and Decimal(str(event_message["deal_stock"])) == s_decimal_0:
+                order_state = OrderState.CANCELED
+            else:
+                order_state = OrderState.FILLED
+
+            event_message["order_state"] = order_state
+            order_update = self._create_order_update(order_msg=event_message, order=order)
+            self._order_tracker.process_order_update(order_update)
+
+    def _process_balance_message(self, params: List[Any]):
+        for data in params:
+            for token, balance_info in data.items():
+                available = Decimal(str(balance_info["available"]))
+                self._balance_sequence += 1
+                self._balance_sequences[token] = self._balance_sequence
+                total = available + Decimal(str(balance_info["freeze"]))
+                self._set_balance(token=token, total=total, available=available)
+                self._drop_projected_balance_deltas(token=token, sequence=self._balance_sequence)
+
+    def _set_balance(self, token: str, total: Decimal, available: Decimal):
+        if self._account_balances.get(token) != total:
+            self._account_balances[token] = total
+        if self._account_available_balances.get(token) != available:
+            self._account_available_balances[token] = available
+
+    def get_balance(self, currency: str) -> Decimal:
+        total, _ = self._projected_balance_delta(token=currency)
+        return super().get_balance(currency) + total
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        _, available = self._projected_balance_delta(token=currency)
+        return super().get_available_balance(currency) + available
+
+    def get_all_balances(self) -> Dict[str, Decimal]:
+        balances = super().get_all_balances()
+        for token in self._projected_balance_deltas:
+            total, _ = self._projected_balance_delta(token=token)
+            balances[token] = balances.get(token, s_decimal_0) + total
+        return balances
+
+    def trigger_event(self, event_tag: Enum, message: Any):
+        if self.LOCAL_BALANCE_PROJECTION:
+            try:
+                self._project_balances(event_tag=event_tag, event=message)
             except Exception:
-                self.logger().exception("Unexpected error in user stream listener loop.")
-                await self._sleep(5.0)
+                self.logger().exception(f"Error projecting the balances for the event {message}.")
+        super().trigger_event(event_tag, message)
+
+    def _project_balances(self, event_tag: Enum, event: Any):
+        if event_tag in (MarketEvent.BuyOrderCreated, MarketEvent.SellOrderCreated):
+            order = self._order_tracker.fetch_order(client_order_id=event.order_id)
+            if order is not None and order.order_type != OrderType.MARKET:
+                self._projected_locks[order.client_order_id] = order.amount
+                self._release_projected_lock(order=order, amount=-order.amount)
+        elif event_tag == MarketEvent.OrderFilled:
+            order = self._order_tracker.fetch_order(client_order_id=event.order_id)
+            if order is not None:
+                self._project_fill(order=order, amount=event.amount, price=event.price, fee=event.trade_fee)
+        elif event_tag in (MarketEvent.OrderCancelled, MarketEvent.OrderFailure):
+            order = self._order_tracker.fetch_order(client_order_id=event.order_id)
+            remaining_amount = self._projected_locks.pop(event.order_id, None)
+            if order is not None and remaining_amount is not None:
+                self._release_projected_lock(order=order, amount=remaining_amount)
+        elif event_tag in (MarketEvent.BuyOrderCompleted, MarketEvent.SellOrderCompleted):
+            self._projected_locks.pop(event.order_id, None)
+
+    def _project_fill(self, order: InFlightOrder, amount: Decimal, price: Decimal, fee: TradeFeeBase):
+        remaining_amount = self._projected_locks.get(order.client_order_id)
+        if remaining_amount is not None:
+            released_amount = min(amount, remaining_amount)
+            self._projected_locks[order.client_order_id] = remaining_amount - released_amount
+            self._release_projected_lock(order=order, amount=released_amount)
+
+        quote_amount = amount * price
+        if order.trade_type == TradeType.BUY:
+            self._add_projected_balance_delta(token=order.base_asset, delta=amount)
+            self._add_projected_balance_delta(token=order.quote_asset, delta=-quote_amount)
+        else:
+            self._add_projected_balance_delta(token=order.base_asset, delta=-amount)
+            self._add_projected_balance_delta(token=order.quote_asset, delta=quote_amount)
+        for fee_amount in fee.flat_fees:
+            self._add_projected_balance_delta(token=fee_amount.token, delta=-fee_amount.amount)
+
+    def _release_projected_lock(self, order: InFlightOrder, amount: Decimal):
+        # Moves the funds of `amount` base units of the order from locked to available (negative amounts lock them)
+        if order.trade_type == TradeType.BUY:
+            self._add_projected_balance_delta(
+                token=order.quote_asset, delta=amount * order.price, total_delta=s_decimal_0
+            )
+        else:
+            self._add_projected_balance_delta(token=order.base_asset, delta=amount, total_delta=s_decimal_0)
+
+    def _add_projected_balance_delta(self, token: str, delta: Decimal, total_delta: Optional[Decimal] = None):
+        # The change takes a sequence number after every balance update applied so far, so only the balance updates
+        # received (or requested) after it can cover it. Order and trade events of the user stream do not drop it:
+        # until the balance channel reports the asset again the exchange balance does not include the change yet
+        total_delta = delta if total_delta is None else total_delta
+        self._balance_sequence += 1
+        self._projected_balance_deltas.setdefault(token, []).append((self._balance_sequence, total_delta, delta))
+
+    def _projected_balance_delta(self, token: str) -> Tuple[Decimal, Decimal]:
+        deltas = self._projected_balance_deltas.get(token, [])
+        return (
+            sum((total_delta for _, total_delta, _ in deltas), s_decimal_0),
+            sum((available_delta for _, _, available_delta in deltas), s_decimal_0),
+        )
+
+    def _drop_projected_balance_deltas(self, token: str, sequence: int):
+        # A balance update received from the exchange covers the projected changes made before it
+        deltas = [delta for delta in self._projected_balance_deltas.get(token, []) if delta[0] > sequence]
+        if len(deltas) > 0:
+            self._projected_balance_deltas[token] = deltas
+        else:
+            self._projected_balance_deltas.pop(token, None)
 
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         trading_rules = []
+        # The symbol map can still be the one loaded from the markets cache, which does not know the markets listed
+        # since then. It is refreshed from the same response before resolving the trading pairs
+        self._initialize_trading_pair_symbols_from_exchange_info(exchange_info=exchange_info_dict)
 
         for info in exchange_info_dict.get("result", []):
             try:
                 if utils.is_exchange_information_valid(exchange_info=info):
-                    trading_rules.append(
-                        TradingRule(
+                    # Markets whose information did not change since the last parse keep their trading rule
+                    fingerprint = json.dumps(info, sort_keys=True)
+                    trading_rule = self._parsed_trading_rules.get(info["name"])
+                    if trading_rule is None or self._markets_fingerprints.get(info["name"]) != fingerprint:
+                        trading_rule = TradingRule(
                             trading_pair=await self.trading_pair_associated_to_exchange_symbol(symbol=info["name"]),
                             min_order_size=Decimal(info["minAmount"]),
                             min_order_value=Decimal(info["minTotal"]),
                             max_price_significant_digits=Decimal(info["moneyPrec"]),
-                            min_base_amount_increment=Decimal(1) / (Decimal(10) ** Decimal(str(info["stockPrec"]))),
-                            min_quote_amount_increment=Decimal(1) / (Decimal(10) ** Decimal(str(info["moneyPrec"]))),
-                            min_price_increment=Decimal(1) / (Decimal(10) ** Decimal(str(info["moneyPrec"]))),
+                            min_base_amount_increment=_precision_increment(str(info["stockPrec"])),
+                            min_quote_amount_increment=_precision_increment(str(info["moneyPrec"])),
+                            min_price_increment=_precision_increment(str(info["moneyPrec"])),
                         )
-                    )
+                        self._parsed_trading_rules[info["name"]] = trading_rule
+                        self._markets_fingerprints[info["name"]] = fingerprint
+                    trading_rules.append(trading_rule)
             except Exception:
                 self.logger().exception(f"Error parsing the trading pair rule {info}. Skipping.")
         return trading_rules
 
+    async def _update_trading_rules(self):
+        await super()._update_trading_rules()
+        if self.MARKETS_CACHE_ENABLED:
+            self._save_markets_cache()
+
+    def _markets_cache_path(self) -> str:
+        return os.path.join(data_path(), CONSTANTS.MARKETS_CACHE_FILE_NAME)
+
+    def _load_markets_cache(self):
+        try:
+            with open(self._markets_cache_path()) as cache_file:
+                markets_cache = json.load(cache_file)
+        except FileNotFoundError:
+            return
+        except Exception:
+            self.logger().warning("The Whitebit markets cache could not be read and will be rebuilt.", exc_info=True)
+            return
+        if markets_cache.get("version") != CONSTANTS.MARKETS_CACHE_VERSION:
+            return
+
+        mapping = bidict()
+        for symbol, market in markets_cache.get("markets", {}).items():
+            rule = market["trading_rule"]
+            trading_rule = TradingRule(
+                trading_pair=market["trading_pair"],
+                min_order_size=Decimal(rule["min_order_size"]),
+                min_order_value=Decimal(rule["min_order_value"]),
+                max_price_significant_digits=Decimal(rule["max_price_significant_digits"]),
+                min_base_amount_increment=Decimal(rule["min_base_amount_increment"]),
+                min_quote_amount_increment=Decimal(rule["min_quote_amount_increment"]),
+                min_price_increment=Decimal(rule["min_price_increment"]),
+            )
+            mapping[symbol] = market["trading_pair"]
+            self._parsed_trading_rules[symbol] = trading_rule
+            self._markets_fingerprints[symbol] = market["fingerprint"]
+            self._trading_rules[trading_rule.trading_pair] = trading_rule
+        if len(mapping) > 0:
+            self._set_trading_pair_symbol_map(mapping)
+
+    def _save_markets_cache(self):
+        mapping = self._trading_pair_symbol_map or {}
+        markets = {}
+        for symbol, trading_rule in self._parsed_trading_rules.items():
+            if symbol not in mapping:
+                continue
+            markets[symbol] = {
+                "trading_pair": mapping[symbol],
+                "fingerprint": self._markets_fingerprints[symbol],
+                "trading_rule": {
+                    "min_order_size": str(trading_rule.min_order_size),
+                    "min_order_value": str(trading_rule.min_order_value),
+                    "max_price_significant_digits": str(trading_rule.max_price_significant_digits),
+                    "min_base_amount_increment": str(trading_rule.min_base_amount_increment),
+                    "min_quote_amount_increment": str(trading_rule.min_quote_amount_increment),
+                    "min_price_increment": str(trading_rule.min_price_increment),
+                },
+            }
+
+        cache_path = self._markets_cache_path()
+        temporary_path = f"{cache_path}.tmp"
+        try:
+            with open(temporary_path, "w") as cache_file:
+                json.dump({"version": CONSTANTS.MARKETS_CACHE_VERSION, "markets": markets}, cache_file)
+            os.replace(temporary_path, cache_path)
+        except Exception:
+            self.logger().warning("Error saving the Whitebit markets cache.", exc_info=True)
+
+    async def _request_order_fills_page(self, exchange_order_id: str, offset: int) -> List[Dict[str, Any]]:
+        fills_result = await self._api_post(
+            path_url=CONSTANTS.WHITEBIT_ORDER_TRADES_PATH,
+            data={
+                "orderId": int(exchange_order_id),
+                "limit": CONSTANTS.ORDER_FILLS_REQUEST_LIMIT,
+                "offset": offset,
+            },
+            is_auth_required=True,
+        )
+
+        is_invalid_order_id = (
+            fills_result.get("status") != CONSTANTS.ORDER_FILLS_REQUEST_INVALID_ORDER_ID_ERROR_CODE
+        )
+        has_warnings = f"Finished order id {exchange_order_id}" in fills_result.get("warning", "")
+        if is_invalid_order_id and not has_warnings:
+            return fills_result["records"]
+        return []
+
     async def _request_order_fills(self, order: InFlightOrder):
+        """
+        Requests only the fills newer than the last trade id seen for the order. The exchange returns the deals newest
+        first, so paging stops at the first page reaching the cursor. When more pages are needed they are requested
+        concurrently, ORDER_FILLS_CONCURRENT_PAGES at a time, and the throttler keeps them within the rate limits.
+        """
         order_fills = []
         if order.exchange_order_id is not None:
-            pagination_limit = 100
-            pagination_offset = 0
-            has_more_pages = True
-
-            while has_more_pages:
-                has_more_pages = False
-
-                fills_result = await self._api_post(
-                    path_url=CONSTANTS.WHITEBIT_ORDER_TRADES_PATH,
-                    data={
-                        "orderId": int(order.exchange_order_id),
-                        "limit": pagination_limit,
-                        "offset": pagination_offset,
-                    },
-                    is_auth_required=True,
-                )
-
-                is_invalid_order_id = (
-                    fills_result.get("status") != CONSTANTS.ORDER_FILLS_REQUEST_INVALID_ORDER_ID_ERROR_CODE
-                )
-                has_warnings = f"Finished order id {order.exchange_order_id}" in fills_result.get("warning", "")
-                if is_invalid_order_id and not has_warnings:
-                    order_fills.extend(fills_result["records"])
-
-                    if len(fills_result["records"]) == pagination_limit:
-                        has_more_pages = True
-                        pagination_offset += pagination_limit
+            exchange_order_id = order.exchange_order_id
+            last_trade_id = self._order_fills_cursors.get(exchange_order_id, 0)
+            pagination_limit = CONSTANTS.ORDER_FILLS_REQUEST_LIMIT
+            pages = [await self._request_order_fills_page(exchange_order_id=exchange_order_id, offset=0)]
+            next_offset = pagination_limit
+
+            while len(pages) > 0:
+                has_more_pages = True
+                for records in pages:
+                    new_records = [record for record in records if int(record["id"]) > last_trade_id]
+                    order_fills.extend(new_records)
+                    if len(records) < pagination_limit or len(new_records) < len(records):
+                        has_more_pages = False
+                        break
+
+                pages = []
+                if has_more_pages:
+                    offsets = [next_offset + page * pagination_limit
+                               for page in range(CONSTANTS.ORDER_FILLS_CONCURRENT_PAGES)]
+                    pages = await safe_gather(*[
+                        self._request_order_fills_page(exchange_order_id=exchange_order_id, offset=offset)
+                        for offset in offsets
+                    ])
+                    next_offset = offsets[-1] + pagination_limit
+
+            if len(order_fills) > 0:
+                self._order_fills_cursors[exchange_order_id] = max(int(record["id"]) for record in order_fills)
+            if order.is_done:
+                self._order_fills_cursors.pop(exchange_order_id, None)
 
         return order_fills
 
@@ -361,19 +1149,150 @@ class WhitebitExchange(ExchangePyBase):
 
         return result
 
+    async def _request_bulk_order_status(self, trading_pairs: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches the active orders of each market (one request per market) and the recent orders history (one request)
+
+        :param trading_pairs: trading pairs with tracked orders
+
+        :return: the latest known status message of each order, keyed by client order id
+        """
+        orders_status = {}
+        symbols = [await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+                   for trading_pair in trading_pairs]
+
+        active_orders_results = await safe_gather(*[
+            self._api_post(
+                path_url=CONSTANTS.WHITEBIT_ACTIVE_ORDER_STATUS_PATH,
+                data={"market": symbol, "limit": CONSTANTS.ACTIVE_ORDERS_REQUEST_LIMIT},
+                is_auth_required=True,
+            )
+            for symbol in symbols
+        ])
+        for active_orders_result in active_orders_results:
+            for active_order_status in active_orders_result:
+                active_order_status["order_state"] = OrderState.OPEN
+                orders_status[str(active_order_status.get("clientOrderId"))] = active_order_status
+
+        # The history is requested after the active orders, so an order executed in between is reported as filled
+        executed_orders_result = await self._api_post(
+            path_url=CONSTANTS.WHITEBIT_EXECUTED_ORDER_STATUS_PATH,
+            data={"limit": CONSTANTS.ORDER_HISTORY_REQUEST_LIMIT},
+            is_auth_required=True,
+        )
+        if len(executed_orders_result) > 0:
+            # If there are no executed orders the result is an empty list. Otherwise, it is a dictionary
+            for symbol in symbols:
+                for executed_order_status in executed_orders_result.get(symbol, []):
+                    executed_order_status["order_state"] = OrderState.FILLED
+                    orders_status[str(executed_order_status.get("clientOrderId"))] = executed_order_status
+
+        return orders_status
+
+    async def _update_order_status(self):
+        available_requests = self._throttler.available_capacity(limit_id=CONSTANTS.WHITEBIT_GENERAL_RATE_LIMIT)
+        if available_requests < self.STATUS_UPDATE_MIN_AVAILABLE_REQUESTS:
+            self.logger().debug("Skipping the order status update, the rate limit budget is reserved for orders.")
+            return
+        if self.BULK_ORDER_STATUS_UPDATE:
+            await self._update_orders_in_bulk()
+        else:
+            await super()._update_order_status()
+
+    async def _update_orders_in_bulk(self):
+        """
+        Updates the fills and the status of the tracked orders from the bulk status responses. The number of requests
+        depends on the number of markets, not on the number of orders: fills are only requested for the orders whose
+        executed amount changed, and the individual status requests are bounded per cycle
+        """
+        fillable_orders = self._order_tracker.all_fillable_orders.copy()
+        orders_to_update = self.in_flight_orders.copy()
+        if len(fillable_orders) == 0 and len(orders_to_update) == 0:
+            return
+
+        trading_pairs = {order.trading_pair for order in fillable_orders.values()}
+        trading_pairs.update(order.trading_pair for order in orders_to_update.values())
+        try:
+            orders_status = await self._request_bulk_order_status(trading_pairs=trading_pairs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(f"Error fetching bulk order status updates: {request_error}.")
+            return
+
+        missing_orders = [
+            order for client_order_id, order in orders_to_update.items() if client_order_id not in orders_status
+        ]
+        for order in self._orders_for_individual_status_request(orders=missing_orders):
+            try:
+                order_data = await self._request_order_update(order=order)
+                if len(order_data) > 0:
+                    orders_status[order.client_order_id] = order_data[-1]
+                elif order.exchange_order_id is not None:
+                    # See _request_order_status
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as request_error:
+                if self._is_order_not_found_during_status_update_error(status_update_exception=request_error):
+                    await self._order_tracker.process_order_not_found(order.client_order_id)
+                else:
+                    self.logger().warning(
+                        f"Error fetching status update for the order {order.client_order_id}: {request_error}."
+                    )
+
+        # The fills are processed before the status, so an order is not completed before its last fill is known
+        orders_with_new_fills = [
+            order for client_order_id, order in fillable_orders.items()
+            if client_order_id in orders_status
+            and Decimal(str(orders_status[client_order_id].get("dealStock", "0"))) != order.executed_amount_base
+        ]
+        await self._update_orders_fills(orders=orders_with_new_fills)
+
+        for client_order_id, order in orders_to_update.items():
+            order_msg = orders_status.get(client_order_id)
+            if order_msg is not None and client_order_id in self.in_flight_orders:
+                try:
+                    order_update = self._create_order_update(order_msg=order_msg, order=order)
+                    self._order_tracker.process_order_update(order_update)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as update_error:
+                    self.logger().warning(
+                        f"Error processing the status update of the order {client_order_id}: {update_error}."
+                    )
+
+    def _orders_for_individual_status_request(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        # The orders requested longest ago go first, so every missing order is eventually requested
+        missing_ids = {order.client_order_id for order in orders}
+        for client_order_id in list(self._individual_status_request_timestamps):
+            if client_order_id not in missing_ids:
+                del self._individual_status_request_timestamps[client_order_id]
+        selected_orders = sorted(
+            orders, key=lambda order: self._individual_status_request_timestamps.get(order.client_order_id, 0.0)
+        )[:self.BULK_ORDER_STATUS_MAX_INDIVIDUAL_REQUESTS]
+        now = self._time()
+        for order in selected_orders:
+            self._individual_status_request_timestamps[order.client_order_id] = now
+        return selected_orders
+
     async def _all_trade_updates_for_order(self, order: InFlightOrder) -> List[TradeUpdate]:
         trade_updates = []
         try:
             if order.exchange_order_id is not None:
+                exchange_order_id = str(order.exchange_order_id)
                 all_fills_response = await self._request_order_fills(order=order)
                 for trade_fill in all_fills_response:
+                    trade_id = str(trade_fill["id"])
+                    if self._is_duplicate_trade(exchange_order_id=exchange_order_id, trade_id=trade_id):
+                        continue
                     trade_update = self._create_trade_update(trade_msg=trade_fill, order=order)
                     trade_updates.append(trade_update)
+                    self._register_seen_trade(exchange_order_id=exchange_order_id, trade_id=trade_id)
         except asyncio.CancelledError:
             raise
         except Exception as ex:
-            is_error_caused_by_unexistent_order = '"code":50005' in str(ex)
-            if not is_error_caused_by_unexistent_order:
+            if not self._is_order_not_found_error(exception=ex):
                 raise
 
         return trade_updates
@@ -381,33 +1300,57 @@ class WhitebitExchange(ExchangePyBase):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         updated_order_data = await self._request_order_update(order=tracked_order)
         if len(updated_order_data) > 0:
-            order_update = self._create_order_update(order_msg=updated_order_data[-1], order=tracked_order)
-        else:
-            order_update = OrderUpdate(
-                client_order_id=tracked_order.client_order_id,
-                trading_pair=tracked_order.trading_pair,
-                update_timestamp=self.current_timestamp,
-                new_state=tracked_order.current_state,
+            return self._create_order_update(order_msg=updated_order_data[-1], order=tracked_order)
+        if tracked_order.exchange_order_id is not None:
+            # The exchange acknowledged the order, but it is neither active nor in the orders history. The responses
+            # can lag behind the order events, so the order is reported as not found and the order tracker only
+            # considers it lost after several consecutive misses
+            raise IOError(
+                f"Order {tracked_order.client_order_id} not found: "
+                f"{{'code': {CONSTANTS.ORDER_NOT_FOUND_ERROR_CODE}, 'message': '{CONSTANTS.ORDER_NOT_FOUND_MESSAGE}'}}"
             )
-        return order_update
+        return OrderUpdate(
+            client_order_id=tracked_order.client_order_id,
+            trading_pair=tracked_order.trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=tracked_order.current_state,
+        )
 
     def _create_trade_update(self, trade_msg: Dict[str, Any], order: InFlightOrder):
+        return self._build_trade_update(
+            trade_id=str(trade_msg["id"]),
+            order=order,
+            price=Decimal(trade_msg["price"]),
+            amount=Decimal(trade_msg["amount"]),
+            fee_amount=Decimal(trade_msg["fee"]),
+            timestamp=float(trade_msg["time"]),
+        )
+
+    def _build_trade_update(
+        self,
+        trade_id: str,
+        order: InFlightOrder,
+        price: Decimal,
+        amount: Decimal,
+        fee_amount: Decimal,
+        timestamp: float,
+    ) -> TradeUpdate:
         fee = TradeFeeBase.new_spot_fee(
             fee_schema=self.trade_fee_schema(),
             trade_type=order.trade_type,
             percent_token=order.quote_asset,
-            flat_fees=[TokenAmount(amount=Decimal(trade_msg["fee"]), token=order.quote_asset)],
+            flat_fees=[TokenAmount(amount=fee_amount, token=order.quote_asset)],
         )
         trade_update = TradeUpdate(
-            trade_id=str(trade_msg["id"]),
+            trade_id=trade_id,
             client_order_id=order.client_order_id,
             exchange_order_id=order.exchange_order_id,
             trading_pair=order.trading_pair,
             fee=fee,
-            fill_base_amount=Decimal(trade_msg["amount"]),
-            fill_quote_amount=Decimal(trade_msg["amount"]) * Decimal(trade_msg["price"]),
-            fill_price=Decimal(trade_msg["price"]),
-            fill_timestamp=float(trade_msg["time"]),
+            fill_base_amount=amount,
+            fill_quote_amount=amount * price,
+            fill_price=price,
+            fill_timestamp=timestamp,
         )
         return trade_update
 
@@ -428,27 +1371,160 @@ class WhitebitExchange(ExchangePyBase):
         return order_update
 
     async def _update_balances(self):
-        response = await self._api_post(path_url=CONSTANTS.WHITEBIT_BALANCE_PATH, is_auth_required=True)
+        available_requests = self._throttler.available_capacity(limit_id=CONSTANTS.WHITEBIT_GENERAL_RATE_LIMIT)
+        if available_requests < self.BALANCE_UPDATE_MIN_AVAILABLE_REQUESTS:
+            self.logger().debug("Skipping the balance update, the rate limit budget is reserved for order requests.")
+            return
 
-        self._account_available_balances.clear()
-        self._account_balances.clear()
+        if self._is_balance_stream_healthy() and (
+            self._time() - self._last_full_balance_update < self.BALANCE_FULL_REFRESH_INTERVAL
+        ):
+            return
+
+        request_sequence = self._balance_sequence
+        response = await self._api_post(path_url=CONSTANTS.WHITEBIT_BALANCE_PATH, is_auth_required=True)
 
+        # Changes are applied in place, so the balances are never seen empty. Assets that received a user stream update
+        # after the request was sent keep the streamed values
         for token, balance_details in response.items():
-            self._account_balances[token] = Decimal(balance_details["available"]) + Decimal(balance_details["freeze"])
-            self._account_available_balances[token] = Decimal(balance_details["available"])
+            if self._balance_sequences.get(token, 0) <= request_sequence:
+                available = Decimal(balance_details["available"])
+                total = available + Decimal(balance_details["freeze"])
+                self._set_balance(token=token, total=total, available=available)
+            self._drop_projected_balance_deltas(token=token, sequence=request_sequence)
+        for token in list(self._account_balances):
+            if token not in response and self._balance_sequences.get(token, 0) <= request_sequence:
+                self._account_balances.pop(token, None)
+                self._account_available_balances.pop(token, None)
+        for token in list(self._projected_balance_deltas):
+            if token not in response:
+                self._drop_projected_balance_deltas(token=token, sequence=request_sequence)
+        self._last_full_balance_update = self._time()
+
+    def _is_balance_stream_healthy(self) -> bool:
+        return self._last_full_balance_update > 0 and self._is_user_stream_channel_healthy(
+            channel=CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL
+        )
 
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
+        # The factory is the first component built on top of the throttler, so this is the point to replace the
+        # default throttler with the one that keeps the wait statistics per request priority
+        self._throttler = WhitebitThrottler(
+            rate_limits=self.rate_limits_rules,
+            limits_share_percentage=self._client_config.rate_limits_share_pct,
+        )
         return web_utils.build_api_factory(
             throttler=self._throttler, time_synchronizer=self._time_synchronizer, auth=self._auth
         )
 
+    @property
+    def request_metrics(self) -> Dict[str, Any]:
+        """
+        Returns the latency summary of each request path split by phase (throttle, sign, network and parse), the
+        error counts by path and error code, and the number of requests rejected by the exchange rate limit
+        """
+        return self._metrics.snapshot()
+
+    async def _api_request(
+        self,
+        path_url,
+        overwrite_url: Optional[str] = None,
+        method: RESTMethod = RESTMethod.GET,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        is_auth_required: bool = False,
+        return_err: bool = False,
+        limit_id: Optional[str] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        phases, phases_token = whitebit_metrics.start_request_phases()
+        start_time = None
+        network_end_time = None
+        error = None
+        try:
+            rest_assistant = await self._web_assistants_factory.get_rest_assistant()
+            url = overwrite_url or await self._api_request_url(path_url=path_url, is_auth_required=is_auth_required)
+            start_time = time.perf_counter()
+            response = await rest_assistant.execute_request_and_get_response(
+                url=url,
+                params=params,
+                data=data,
+                method=method,
+                is_auth_required=is_auth_required,
+                return_err=True,
+                throttler_limit_id=limit_id if limit_id else path_url,
+                headers=headers,
+            )
+            response_text = await response.text()
+            network_end_time = time.perf_counter()
+            if response.status >= 400:
+                error = str(response.status)
+                self._record_request_error(path_url=path_url, status=response.status, response_text=response_text)
+                if not return_err:
+                    raise IOError(
+                        f"Error executing request {method.name} {url}. HTTP status is {response.status}. "
+                        f"Error: {response_text}"
+                    )
+            result = self._decode_json(response_text)
+            phases[whitebit_metrics.PHASE_PARSE] = time.perf_counter() - network_end_time
+        except asyncio.CancelledError:
+            error = "cancelled"
+            raise
+        except Exception as exception:
+            error = error or type(exception).__name__
+            raise
+        finally:
+            whitebit_metrics.end_request_phases(phases_token)
+            # Failed requests are recorded too, with the time spent until they failed
+            if start_time is not None:
+                phases[whitebit_metrics.PHASE_NETWORK] = max(
+                    0.0,
+                    (network_end_time or time.perf_counter())
+                    - start_time
+                    - phases.get(whitebit_metrics.PHASE_THROTTLE, 0.0)
+                    - phases.get(whitebit_metrics.PHASE_SIGN, 0.0),
+                )
+            self._metrics.record_request(path=path_url, phases=phases, error=error)
+            self._log_metrics_summary()
+        return result
+
+    def _decode_json(self, text: str) -> Any:
+        if self.FAST_JSON_DECODE and orjson is not None:
+            return orjson.loads(text)
+        return json.loads(text)
+
+    def _record_request_error(self, path_url: str, status: int, response_text: str):
+        code = str(status)
+        try:
+            error_code = self._decode_json(response_text).get("code")
+            if error_code is not None:
+                code = f"{status}/{error_code}"
+        except Exception:
+            pass
+        self._metrics.record_error(path=path_url, code=code, rate_limited=status == 429)
+
+    def _log_metrics_summary(self):
+        now = self._time()
+        if now - self._last_metrics_log >= self.METRICS_LOG_INTERVAL:
+            if self._last_metrics_log > 0:
+                self.logger().info(self._metrics.summary())
+            self._last_metrics_log = now
+
     def _create_order_book_data_source(self) -> OrderBookTrackerDataSource:
+        if self.WS_ORDER_BOOK_SHARDS > 1 and len(self._trading_pairs or []) > 1:
+            return WhitebitShardedAPIOrderBookDataSource(
+                trading_pairs=self._trading_pairs,
+                connector=self,
+                api_factory=self._web_assistants_factory,
+                shards=self.WS_ORDER_BOOK_SHARDS,
+            )
         return WhitebitAPIOrderBookDataSource(
             trading_pairs=self._trading_pairs, connector=self, api_factory=self._web_assistants_factory
         )
 
     def _create_user_stream_data_source(self) -> UserStreamTrackerDataSource:
-        return WhitebitAPIUserStreamDataSource(
+        return WhitebitTrackedAPIUserStreamDataSource(
             auth=self._auth, trading_pairs=self._trading_pairs, connector=self, api_factory=self._web_assistants_factory
         )
 
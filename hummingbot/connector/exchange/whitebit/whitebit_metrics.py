@@ -0,0 +1,139 @@
+import math
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
+
+PHASE_THROTTLE = "throttle"
+PHASE_SIGN = "sign"
+PHASE_NETWORK = "network"
+PHASE_PARSE = "parse"
+PHASES = (PHASE_THROTTLE, PHASE_SIGN, PHASE_NETWORK, PHASE_PARSE)
+
+# Phase durations of the request being executed in the current task. The throttler and the authenticator add their
+# phases to it, and the connector records them once the request finishes
+_request_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("whitebit_request_phases", default=None)
+
+
+def start_request_phases() -> Tuple[Dict[str, float], Any]:
+    phases = {}
+    return phases, _request_phases.set(phases)
+
+
+def end_request_phases(token: Any):
+    _request_phases.reset(token)
+
+
+def add_request_phase(phase: str, duration: float):
+    phases = _request_phases.get()
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + duration
+
+
+class LatencyHistogram:
+    """
+    Fixed memory latency histogram with logarithmic buckets, in the style of HDR histograms. Each bucket covers a range
+    of values within BUCKET_PRECISION of each other, so percentiles keep that relative precision from microseconds to
+    minutes
+    """
+
+    BUCKET_PRECISION = 0.05
+    MIN_VALUE = 1e-6
+
+    def __init__(self):
+        self._log_base = math.log1p(self.BUCKET_PRECISION)
+        self._buckets: Dict[int, int] = defaultdict(int)
+        self._count = 0
+        self._total = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, value: float):
+        value = max(value, self.MIN_VALUE)
+        self._buckets[int(math.log(value / self.MIN_VALUE) / self._log_base)] += 1
+        self._count += 1
+        self._total += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def percentile(self, percentile: float) -> float:
+        if self._count == 0:
+            return 0.0
+        target = math.ceil(self._count * percentile / 100)
+        accumulated = 0
+        for bucket in sorted(self._buckets):
+            accumulated += self._buckets[bucket]
+            if accumulated >= target:
+                # Upper bound of the bucket, capped by the largest value seen
+                return min(self.MIN_VALUE * math.exp((bucket + 1) * self._log_base), self._max)
+        return self._max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self._count,
+            "mean": self._total / self._count if self._count > 0 else 0.0,
+            "min": self._min if self._count > 0 else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self._max,
+        }
+
+
+class WhitebitMetrics:
+    """
+    Request metrics of the Whitebit connector: latency histograms per path and phase, error counts per path and error
+    code, and the number of requests rejected by the exchange rate limit
+    """
+
+    def __init__(self):
+        self._latencies: Dict[str, Dict[str, LatencyHistogram]] = defaultdict(
+            lambda: {phase: LatencyHistogram() for phase in PHASES}
+        )
+        self._error_counts: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._rate_limited_counts: Dict[str, int] = defaultdict(int)
+
+    def record_request(self, path: str, phases: Dict[str, float], error: Optional[str] = None):
+        """
+        Records the phase durations of a request
+
+        :param path: the request path
+        :param phases: the duration of each phase measured before the request finished
+        :param error: tag of the failure (HTTP status or exception name), None for successful requests. Failed requests
+            are kept in their own histograms, as "<path> (<error>)", so they do not skew the latency of the path
+        """
+        histograms = self._latencies[path if error is None else f"{path} ({error})"]
+        for phase, duration in phases.items():
+            histograms[phase].record(duration)
+
+    def record_error(self, path: str, code: str, rate_limited: bool = False):
+        self._error_counts[path][code] += 1
+        if rate_limited:
+            self._rate_limited_counts[path] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "latency": {
+                path: {phase: histogram.summary() for phase, histogram in histograms.items() if histogram.count > 0}
+                for path, histograms in self._latencies.items()
+            },
+            "errors": {path: dict(counts) for path, counts in self._error_counts.items()},
+            "rate_limited": dict(self._rate_limited_counts),
+        }
+
+    def summary(self) -> str:
+        lines: List[str] = ["Whitebit request metrics (p50/p99 ms):"]
+        for path, histograms in sorted(self._latencies.items()):
+            phases = " ".join(
+                f"{phase}={histogram.percentile(50) * 1e3:.1f}/{histogram.percentile(99) * 1e3:.1f}"
+                for phase, histogram in histograms.items()
+                if histogram.count > 0
+            )
+            lines.append(f"  {path} requests={histograms[PHASE_NETWORK].count} {phases}")
+        for path, counts in sorted(self._error_counts.items()):
+            errors = " ".join(f"{code}={count}" for code, count in sorted(counts.items()))
+            lines.append(f"  {path} errors: {errors} rate_limited={self._rate_limited_counts.get(path, 0)}")
+        return "\n".join(lines)
@@ -0,0 +1,144 @@
+from typing import Iterator, Mapping, Optional
+from weakref import WeakValueDictionary
+
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate
+
+
+class _OrdersView(Mapping):
+    """
+    Read only view over the order dicts of the tracker. Looking up an order does not copy anything, iterating works
+    on a snapshot so callers can keep changing the tracked orders while they iterate
+    """
+
+    def __init__(self, *sources: Mapping):
+        # Sources are sorted from the highest to the lowest priority, as the lost orders override the cached orders
+        # that override the active orders in the dicts built by ClientOrderTracker
+        self._sources = sources
+
+    def __getitem__(self, client_order_id: str) -> InFlightOrder:
+        for source in self._sources:
+            order = source.get(client_order_id)
+            if order is not None:
+                return order
+        raise KeyError(client_order_id)
+
+    def __contains__(self, client_order_id: object) -> bool:
+        return any(client_order_id in source for source in self._sources)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.copy())
+
+    def __len__(self) -> int:
+        return len(self.copy())
+
+    def copy(self) -> dict:
+        orders = {}
+        for source in reversed(self._sources):
+            orders.update(source)
+        return orders
+
+
+class _ExchangeOrderIdView(Mapping):
+    """
+    Read only view of the orders of an _OrdersView keyed by exchange order id, resolved through the index of the
+    tracker
+    """
+
+    def __init__(self, tracker: "WhitebitOrderTracker", orders: _OrdersView):
+        self._tracker = tracker
+        self._orders = orders
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._tracker.fetch_order_by_exchange_order_id(exchange_order_id=exchange_order_id, orders=self._orders)
+        if order is None:
+            raise KeyError(exchange_order_id)
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.copy())
+
+    def __len__(self) -> int:
+        return len(self.copy())
+
+    def copy(self) -> dict:
+        return {
+            order.exchange_order_id: order
+            for order in self._orders.copy().values()
+            if order.exchange_order_id is not None
+        }
+
+
+class WhitebitOrderTracker(ClientOrderTracker):
+    """
+    Order tracker that finds orders without copying the tracked orders. ClientOrderTracker builds a new dict with all
+    the active, cached and lost orders each time all_fillable_orders or all_updatable_orders is accessed, and the
+    trade and order updates of the user stream access them for every message. This tracker returns views that look
+    the order up in place instead, and keeps an index of the orders by exchange order id so no lookup has to scan the
+    tracked orders
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The references are weak, so orders leave the index when the tracker stops keeping them
+        self._orders_by_exchange_id: WeakValueDictionary = WeakValueDictionary()
+
+    @property
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
+        return _OrdersView(self._lost_orders, self._cached_orders, self._in_flight_orders)
+
+    @property
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
+        return _ExchangeOrderIdView(tracker=self, orders=self.all_fillable_orders)
+
+    @property
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
+        return _OrdersView(self._lost_orders, self._in_flight_orders)
+
+    @property
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
+        return _ExchangeOrderIdView(tracker=self, orders=self.all_updatable_orders)
+
+    def start_tracking_order(self, order: InFlightOrder):
+        super().start_tracking_order(order)
+        self.index_order(order=order)
+
+    def process_order_update(self, order_update: OrderUpdate):
+        if order_update.exchange_order_id is not None:
+            order = self.all_fillable_orders.get(order_update.client_order_id)
+            if order is not None:
+                self._orders_by_exchange_id.setdefault(str(order_update.exchange_order_id), order)
+        return super().process_order_update(order_update)
+
+    def index_order(self, order: InFlightOrder):
+        """
+        Registers the exchange order id of an order in the index. Orders get their exchange order id when tracking
+        starts or through an order update, which both index it, so this is only needed for orders the tracker got
+        some other way (e.g. restored states)
+
+        :param order: the order, ignored while it has no exchange order id
+        """
+        if order.exchange_order_id is not None:
+            self._orders_by_exchange_id[str(order.exchange_order_id)] = order
+
+    def fetch_order(
+        self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
+    ) -> Optional[InFlightOrder]:
+        orders = self.all_fillable_orders
+        order = orders.get(client_order_id) if client_order_id is not None else None
+        if order is None and exchange_order_id is not None:
+            order = self.fetch_order_by_exchange_order_id(exchange_order_id=exchange_order_id, orders=orders)
+        return order
+
+    def fetch_order_by_exchange_order_id(self, exchange_order_id: str, orders: Mapping) -> Optional[InFlightOrder]:
+        """
+        Finds an order through the exchange order id index
+
+        :param exchange_order_id: the exchange order id
+        :param orders: the orders the result has to belong to
+        :return: the order, or None if it is not in orders
+        """
+        order = self._orders_by_exchange_id.get(str(exchange_order_id))
+        if order is not None and orders.get(order.client_order_id) is not order:
+            order = None
+        return order
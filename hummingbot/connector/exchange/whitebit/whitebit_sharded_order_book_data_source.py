@@ -0,0 +1,165 @@
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from hummingbot.connector.exchange.whitebit import whitebit_constants as CONSTANTS
+from hummingbot.connector.exchange.whitebit.whitebit_api_order_book_data_source import WhitebitAPIOrderBookDataSource
+from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+if TYPE_CHECKING:
+    from hummingbot.connector.exchange.whitebit.whitebit_exchange import WhitebitExchange
+
+# Shard served by the listener running in the current task
+_current_shard: ContextVar[Optional[int]] = ContextVar("whitebit_order_book_shard", default=None)
+
+
+class WhitebitShardedAPIOrderBookDataSource(WhitebitAPIOrderBookDataSource):
+    """
+    Order book data source that spreads the public channel subscriptions of the trading pairs across several websocket
+    connections (shards). Each shard reconnects on its own and resubscribes only its markets. The connections are
+    opened through the WS_CONNECTION_LIMIT_ID rate limit, and a shard that keeps failing waits longer between
+    attempts, so a reconnection storm stays within the connection budget
+    """
+
+    RECONNECT_MIN_DELAY = 1.0
+    RECONNECT_MAX_DELAY = 30.0
+    # Length of the window used to compute the message rate of each shard
+    MESSAGE_RATE_WINDOW = 10.0
+
+    def __init__(
+        self,
+        trading_pairs: List[str],
+        connector: "WhitebitExchange",
+        api_factory: WebAssistantsFactory,
+        shards: int,
+    ):
+        super().__init__(trading_pairs=trading_pairs, connector=connector, api_factory=api_factory)
+        self._shards_count = max(1, min(shards, len(trading_pairs)))
+        # Shard of each trading pair. A pair keeps its shard for the life of the data source, and pairs added later go
+        # to the shard with the fewest pairs, so adding a pair never moves the others to another connection
+        self._trading_pair_shards: Dict[str, int] = {
+            trading_pair: index % self._shards_count for index, trading_pair in enumerate(sorted(trading_pairs))
+        }
+        self._shard_statistics: List[Dict[str, Any]] = [
+            {
+                "messages": 0,
+                "reconnections": 0,
+                "window_start": 0.0,
+                "window_messages": 0,
+                "last_window_rate": 0.0,
+            }
+            for _ in range(self._shards_count)
+        ]
+
+    @property
+    def shard_statistics(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Returns, for each shard, its trading pairs, the number of messages received and reconnections, and the message
+        rate (messages per second) of the last complete window, or of the current window measured up to now once it is
+        longer than MESSAGE_RATE_WINDOW
+        """
+        now = time.time()
+        return {
+            shard: {
+                "trading_pairs": self._shard_trading_pairs(shard=shard),
+                "messages": statistics["messages"],
+                "reconnections": statistics["reconnections"],
+                "message_rate": self._message_rate(statistics=statistics, now=now),
+            }
+            for shard, statistics in enumerate(self._shard_statistics)
+        }
+
+    def _message_rate(self, statistics: Dict[str, Any], now: float) -> float:
+        # The windows only roll over when a message arrives, so a window open for longer than MESSAGE_RATE_WINDOW is
+        # measured up to now. A shard that stopped receiving messages then reports a decreasing rate
+        if statistics["window_start"] == 0:
+            return 0.0
+        elapsed = now - statistics["window_start"]
+        if elapsed >= self.MESSAGE_RATE_WINDOW:
+            return statistics["window_messages"] / elapsed
+        return statistics["last_window_rate"]
+
+    def _shard_trading_pairs(self, shard: int) -> List[str]:
+        for trading_pair in sorted(self._trading_pairs):
+            if trading_pair not in self._trading_pair_shards:
+                shard_sizes = [0] * self._shards_count
+                for assigned_shard in self._trading_pair_shards.values():
+                    shard_sizes[assigned_shard] += 1
+                self._trading_pair_shards[trading_pair] = shard_sizes.index(min(shard_sizes))
+        return sorted(
+            trading_pair for trading_pair in self._trading_pairs if self._trading_pair_shards[trading_pair] == shard
+        )
+
+    async def listen_for_subscriptions(self):
+        await safe_gather(*[self._listen_for_shard_subscriptions(shard=shard) for shard in range(self._shards_count)])
+
+    async def _listen_for_shard_subscriptions(self, shard: int):
+        _current_shard.set(shard)
+        ws: Optional[WSAssistant] = None
+        failed_attempts = 0
+        while True:
+            try:
+                ws = await self._connected_websocket_assistant()
+                await self._subscribe_shard_channels(ws=ws, trading_pairs=self._shard_trading_pairs(shard=shard))
+                failed_attempts = 0
+                await self._process_websocket_messages(websocket_assistant=ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The websocket connection of shard {shard} was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error occurred when listening to the order book streams of shard {shard}."
+                )
+            finally:
+                await self._on_order_stream_interruption(websocket_assistant=ws)
+                ws = None
+            self._shard_statistics[shard]["reconnections"] += 1
+            failed_attempts += 1
+            await self._sleep(min(self.RECONNECT_MIN_DELAY * 2 ** (failed_attempts - 1), self.RECONNECT_MAX_DELAY))
+
+    async def _subscribe_shard_channels(self, ws: WSAssistant, trading_pairs: List[str]):
+        try:
+            symbols = [
+                await self._connector.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+                for trading_pair in trading_pairs
+            ]
+            trades_payload = {"id": 1, "method": "trades_subscribe", "params": symbols}
+            await ws.send(WSJSONRequest(payload=trades_payload))
+            for symbol in symbols:
+                depth_payload = {
+                    "id": 2,
+                    "method": "depth_subscribe",
+                    "params": [symbol, CONSTANTS.WHITEBIT_WS_ORDER_BOOK_DEPTH, "0", True],
+                }
+                await ws.send(WSJSONRequest(payload=depth_payload))
+            self.logger().info(f"Subscribed to public order book and trade channels of {', '.join(trading_pairs)}...")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(
+                "Unexpected error occurred subscribing to order book trading and delta streams...", exc_info=True
+            )
+            raise
+
+    def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
+        shard = _current_shard.get()
+        if shard is not None:
+            self._record_shard_message(shard=shard)
+        return super()._channel_originating_message(event_message=event_message)
+
+    def _record_shard_message(self, shard: int):
+        statistics = self._shard_statistics[shard]
+        now = time.time()
+        statistics["messages"] += 1
+        statistics["window_messages"] += 1
+        elapsed = now - statistics["window_start"]
+        if elapsed >= self.MESSAGE_RATE_WINDOW:
+            if statistics["window_start"] > 0:
+                statistics["last_window_rate"] = statistics["window_messages"] / elapsed
+            statistics["window_start"] = now
+            statistics["window_messages"] = 0
@@ -0,0 +1,523 @@
+"""
+Offline stand-in for the Whitebit REST and WebSocket APIs, used to load test WhitebitExchange without network access.
+
+It serves the REST paths in whitebit_constants and the public (depth_update, trades_update) and private
+(deals_update, ordersPending_update, balanceSpot_update) WebSocket channels from an in-memory exchange with a synthetic
+order book. Latency, error injection and rate limit rejections are configurable through WhitebitSimulatorConfig.
+
+Usage:
+
+    python -m hummingbot.connector.exchange.whitebit.whitebit_simulator --port 8765 --latency 0.02 --error-rate 0.01
+
+and point the connector to it for the whole run:
+
+    with whitebit_simulator_urls(port=8765):
+        connector = WhitebitExchange(...)
+        ...  # start the connector, run the load test and stop the connector here
+    simulator.check_received_requests()
+
+The connector reads the URLs on every request, so any request sent after the block exits goes to whitebit.com.
+
+Signatures are not verified, any API key is accepted.
+"""
+import argparse
+import asyncio
+import contextlib
+import random
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from aiohttp import WSMsgType, web
+
+from hummingbot.connector.exchange.whitebit import (
+    whitebit_constants as CONSTANTS,
+    whitebit_web_utils as web_utils,
+)
+
+
+@dataclass
+class WhitebitSimulatorConfig:
+    # Markets served by the simulator, with their initial mid price
+    markets: Dict[str, Decimal] = field(
+        default_factory=lambda: {"BTC_USDT": Decimal("30000"), "XRP_USDT": Decimal("0.5")}
+    )
+    # Initial available balance of each asset
+    balances: Dict[str, Decimal] = field(default_factory=lambda: {
+        "BTC": Decimal("10"), "XRP": Decimal("100000"), "USDT": Decimal("1000000")})
+    # Latency added to every REST response: latency + uniform(0, latency_jitter) seconds
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Probability of answering a REST request with an HTTP 500 error
+    error_rate: float = 0.0
+    # Requests per second accepted before answering with HTTP 429
+    rate_limit: int = CONSTANTS.MAX_REQUESTS_LIMIT
+    # Interval between order book and trades updates pushed to the public channels
+    market_update_interval: float = 0.1
+    book_levels: int = 50
+    fee_rate: Decimal = Decimal("0.001")
+    seed: Optional[int] = None
+
+
+@contextlib.contextmanager
+def whitebit_simulator_urls(host: str = "127.0.0.1", port: int = 8765):
+    """
+    Points the connector REST and WebSocket URLs to a local simulator while the block runs. The URLs are read on every
+    request, so the connector has to be started, used and stopped inside the block. Once it exits the original URLs
+    are restored and any further request goes to the real exchange
+    """
+    base_url, ws_uri = CONSTANTS.WHITEBIT_BASE_URL, CONSTANTS.WHITEBIT_WS_URI
+    CONSTANTS.WHITEBIT_BASE_URL = f"http://{host}:{port}/"
+    CONSTANTS.WHITEBIT_WS_URI = f"ws://{host}:{port}/ws"
+    try:
+        check_simulator_urls(host=host, port=port)
+        yield
+    finally:
+        CONSTANTS.WHITEBIT_BASE_URL, CONSTANTS.WHITEBIT_WS_URI = base_url, ws_uri
+
+
+def check_simulator_urls(host: str = "127.0.0.1", port: int = 8765):
+    """
+    Raises ValueError if the URLs built by the connector do not point to the simulator at host:port
+    """
+    base_url = f"http://{host}:{port}/"
+    urls = [
+        web_utils.public_rest_url(path_url=CONSTANTS.WHITEBIT_SERVER_STATUS_PATH),
+        web_utils.private_rest_url(path_url=CONSTANTS.WHITEBIT_BALANCE_PATH),
+    ]
+    wrong_urls = [url for url in urls if not url.startswith(base_url)]
+    if CONSTANTS.WHITEBIT_WS_URI != f"ws://{host}:{port}/ws":
+        wrong_urls.append(CONSTANTS.WHITEBIT_WS_URI)
+    if len(wrong_urls) > 0:
+        raise ValueError(f"The connector URLs do not point to the simulator at {base_url}: {', '.join(wrong_urls)}")
+
+
+class WhitebitSimulator:
+    def __init__(self, config: Optional[WhitebitSimulatorConfig] = None):
+        self._config = config or WhitebitSimulatorConfig()
+        self._random = random.Random(self._config.seed)
+        self._mid_prices: Dict[str, Decimal] = dict(self._config.markets)
+        self._available: Dict[str, Decimal] = defaultdict(Decimal, self._config.balances)
+        self._frozen: Dict[str, Decimal] = defaultdict(Decimal)
+        self._active_orders: Dict[int, Dict[str, Any]] = {}
+        self._orders_history: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._deals: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        self._client_order_ids: Set[str] = set()
+        self._last_order_id = 0
+        self._last_deal_id = 0
+        self._request_times: Deque[float] = deque()
+        self._subscriptions: Dict[str, Set[web.WebSocketResponse]] = defaultdict(set)
+        self._market_subscriptions: Dict[web.WebSocketResponse, Set[str]] = defaultdict(set)
+        self._market_task: Optional[asyncio.Task] = None
+        self._runner: Optional[web.AppRunner] = None
+        self.request_counts: Dict[str, int] = defaultdict(int)
+        self.error_counts: Dict[str, int] = defaultdict(int)
+        self.rate_limited_count = 0
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765):
+        app = web.Application()
+        app.router.add_get("/ws", self._websocket_handler)
+        app.router.add_route("*", "/{path:.*}", self._rest_handler)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        self._market_task = asyncio.ensure_future(self._market_updates_loop())
+
+    async def stop(self):
+        if self._market_task is not None:
+            self._market_task.cancel()
+            self._market_task = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def check_received_requests(self, paths: Optional[List[str]] = None):
+        """
+        Raises AssertionError if the simulator received no REST request (or none for any of the given paths), which
+        means the connector sent its traffic somewhere else
+        """
+        missing_paths = [path for path in paths or [] if self.request_counts.get(path, 0) == 0]
+        if sum(self.request_counts.values()) == 0 or len(missing_paths) > 0:
+            raise AssertionError(
+                f"The simulator did not receive the connector requests (received {dict(self.request_counts)}, "
+                f"missing {missing_paths})"
+            )
+
+    # REST
+
+    async def _rest_handler(self, request: web.Request) -> web.Response:
+        path = request.match_info["path"]
+        self.request_counts[path] += 1
+        await asyncio.sleep(self._config.latency + self._random.uniform(0, self._config.latency_jitter))
+
+        if self._is_rate_limited():
+            self.rate_limited_count += 1
+            return web.json_response({"code": 429, "message": "Too many requests"}, status=429)
+        if self._random.random() < self._config.error_rate:
+            self.error_counts[path] += 1
+            return web.json_response({"code": 500, "message": "Injected error"}, status=500)
+
+        data = await request.json() if request.can_read_body else {}
+        if path.startswith(CONSTANTS.WHITEBIT_ORDER_BOOK_PATH + "/"):
+            return web.json_response(self._order_book_response(path.rsplit("/", 1)[-1]))
+        handler = self._rest_handlers().get(path)
+        if handler is None:
+            return web.json_response({"code": 404, "message": f"Unknown path {path}"}, status=404)
+        try:
+            return web.json_response(await handler(data))
+        except SimulatorRequestError as request_error:
+            return web.json_response(request_error.response, status=request_error.status)
+
+    def _rest_handlers(self):
+        return {
+            CONSTANTS.WHITEBIT_SERVER_STATUS_PATH: self._ping,
+            CONSTANTS.WHITEBIT_SERVER_TIME_PATH: self._server_time,
+            CONSTANTS.WHITEBIT_INSTRUMENTS_PATH: self._markets,
+            CONSTANTS.WHITEBIT_TICKER_PATH: self._ticker,
+            CONSTANTS.WHITEBIT_WS_AUTHENTICATION_TOKEN_PATH: self._websocket_token,
+            CONSTANTS.WHITEBIT_BALANCE_PATH: self._balance,
+            CONSTANTS.WHITEBIT_LIMIT_ORDER_CREATION_PATH: self._new_order,
+            CONSTANTS.WHITEBIT_MARKET_ORDER_CREATION_PATH: self._new_market_order,
+            CONSTANTS.WHITEBIT_BULK_LIMIT_ORDER_CREATION_PATH: self._new_bulk_orders,
+            CONSTANTS.WHITEBIT_ORDER_CANCEL_PATH: self._cancel_order,
+            CONSTANTS.WHITEBIT_ORDER_CANCEL_ALL_PATH: self._cancel_all_orders,
+            CONSTANTS.WHITEBIT_ACTIVE_ORDER_STATUS_PATH: self._orders,
+            CONSTANTS.WHITEBIT_EXECUTED_ORDER_STATUS_PATH: self._history,
+            CONSTANTS.WHITEBIT_ORDER_TRADES_PATH: self._order_deals,
+        }
+
+    def _is_rate_limited(self) -> bool:
+        now = time.time()
+        while len(self._request_times) > 0 and now - self._request_times[0] > 1:
+            self._request_times.popleft()
+        if len(self._request_times) >= self._config.rate_limit:
+            return True
+        self._request_times.append(now)
+        return False
+
+    async def _ping(self, _):
+        return ["pong"]
+
+    async def _server_time(self, _):
+        return {"time": int(time.time())}
+
+    async def _markets(self, _):
+        return {
+            "success": True,
+            "message": "",
+            "result": [
+                {
+                    "name": symbol,
+                    "stock": symbol.split("_")[0],
+                    "money": symbol.split("_")[1],
+                    "stockPrec": "6",
+                    "moneyPrec": "6",
+                    "feePrec": "4",
+                    "makerFee": str(self._config.fee_rate * 100),
+                    "takerFee": str(self._config.fee_rate * 100),
+                    "minAmount": "0.000001",
+                    "minTotal": "1",
+                    "tradesEnabled": True,
+                }
+                for symbol in self._mid_prices
+            ],
+        }
+
+    async def _ticker(self, _):
+        return {
+            symbol: {"last_price": str(mid_price), "base_volume": "0", "quote_volume": "0", "isFrozen": False}
+            for symbol, mid_price in self._mid_prices.items()
+        }
+
+    async def _websocket_token(self, _):
+        return {"websocket_token": "simulator-token"}
+
+    async def _balance(self, _):
+        return self._balances_message(assets=set(self._available) | set(self._frozen))
+
+    def _order_book_response(self, symbol: str) -> Dict[str, Any]:
+        bids, asks = self._book(symbol)
+        return {"ticker_id": symbol, "timestamp": int(time.time()), "bids": bids, "asks": asks}
+
+    async def _new_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._create_order(data=data, order_type="limit")
+
+    async def _new_market_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._create_order(data=data, order_type="market")
+
+    async def _new_bulk_orders(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        results = []
+        for order_data in data.get("orders", []):
+            try:
+                results.append({"result": await self._create_order(data=order_data, order_type="limit"), "error": None})
+            except SimulatorRequestError as request_error:
+                results.append({"result": None, "error": request_error.response})
+        return results
+
+    async def _cancel_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        order = self._active_orders.get(int(data.get("orderId", 0)))
+        if order is None:
+            raise SimulatorRequestError(
+                status=422, response={"code": 2, "message": "Inner validation failed", "errors": {
+                    "orderId": ["Order not found"]}})
+        await self._finish_order(order=order)
+        return order
+
+    async def _cancel_all_orders(self, data: Dict[str, Any]) -> List[Any]:
+        for order in [order for order in self._active_orders.values() if order["market"] == data.get("market")]:
+            await self._finish_order(order=order)
+        return []
+
+    async def _orders(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            order for order in self._active_orders.values()
+            if order["market"] == data.get("market")
+            and data.get("clientOrderId") in (None, order["clientOrderId"])
+            and data.get("orderId") in (None, order["orderId"])
+        ][:data.get("limit", CONSTANTS.ACTIVE_ORDERS_REQUEST_LIMIT)]
+
+    async def _history(self, data: Dict[str, Any]) -> Any:
+        history = {}
+        for symbol, orders in self._orders_history.items():
+            matching_orders = [
+                order for order in reversed(orders)
+                if data.get("orderId") in (None, str(order["id"]))
+                and data.get("clientOrderId") in (None, order["clientOrderId"])
+            ][:data.get("limit", CONSTANTS.ORDER_HISTORY_REQUEST_LIMIT)]
+            if len(matching_orders) > 0 and data.get("market") in (None, symbol):
+                history[symbol] = matching_orders
+        # Whitebit answers with an empty list instead of an empty dictionary
+        return history if len(history) > 0 else []
+
+    async def _order_deals(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        offset = data.get("offset", 0)
+        limit = data.get("limit", CONSTANTS.ORDER_FILLS_REQUEST_LIMIT)
+        deals = list(reversed(self._deals.get(int(data.get("orderId", 0)), [])))
+        return {"records": deals[offset:offset + limit], "offset": offset, "limit": limit}
+
+    # Matching engine
+
+    async def _create_order(self, data: Dict[str, Any], order_type: str) -> Dict[str, Any]:
+        symbol = data.get("market")
+        if symbol not in self._mid_prices:
+            raise SimulatorRequestError(status=422, response={"code": 31, "message": "Market is not available"})
+        client_order_id = data.get("clientOrderId", "")
+        if client_order_id != "" and client_order_id in self._client_order_ids:
+            raise SimulatorRequestError(
+                status=422, response={"code": 32, "message": "Validation failed", "errors": {
+                    "clientOrderId": ["This client order id is already used by the current account."]}})
+
+        base, quote = symbol.split("_")
+        side = data["side"]
+        amount = Decimal(data["amount"])
+        best_bid, best_ask = self._best_prices(symbol)
+        price = Decimal(data["price"]) if order_type == "limit" else (best_ask if side == "buy" else best_bid)
+        locked_asset, locked_amount = (quote, amount * price) if side == "buy" else (base, amount)
+        if self._available[locked_asset] < locked_amount:
+            raise SimulatorRequestError(
+                status=422, response={"code": 10, "message": "Inner validation failed", "errors": {
+                    "amount": ["Not enough balance."]}})
+
+        self._last_order_id += 1
+        now = time.time()
+        order = {
+            "orderId": self._last_order_id,
+            "clientOrderId": client_order_id,
+            "market": symbol,
+            "side": side,
+            "type": order_type,
+            "timestamp": now,
+            "dealMoney": "0",
+            "dealStock": "0",
+            "dealFee": "0",
+            "amount": str(amount),
+            "left": str(amount),
+            "price": str(price),
+            "postOnly": data.get("postOnly") in (True, "true"),
+        }
+        self._client_order_ids.add(client_order_id)
+        self._available[locked_asset] -= locked_amount
+        self._frozen[locked_asset] += locked_amount
+        self._active_orders[order["orderId"]] = order
+        await self._publish_order_event(event_id=1, order=order)
+
+        crosses = price >= best_ask if side == "buy" else price <= best_bid
+        if order_type == "market" or (crosses and not order["postOnly"]):
+            await self._fill_order(order=order, fill_price=price)
+        elif crosses:
+            await self._finish_order(order=order)
+        await self._publish_balances(assets={base, quote})
+        return order
+
+    async def _fill_order(self, order: Dict[str, Any], fill_price: Decimal):
+        base, quote = order["market"].split("_")
+        amount = Decimal(order["left"])
+        deal_money = amount * fill_price
+        fee = deal_money * self._config.fee_rate
+        if order["side"] == "buy":
+            self._frozen[quote] -= amount * Decimal(order["price"])
+            self._available[quote] += amount * Decimal(order["price"]) - deal_money - fee
+            self._available[base] += amount
+        else:
+            self._frozen[base] -= amount
+            self._available[quote] += deal_money - fee
+
+        self._last_deal_id += 1
+        deal = {
+            "time": time.time(),
+            "fee": str(fee),
+            "price": str(fill_price),
+            "amount": str(amount),
+            "id": self._last_deal_id,
+            "dealOrderId": order["orderId"],
+            "clientOrderId": order["clientOrderId"],
+            "role": 2,
+            "deal": str(deal_money),
+        }
+        self._deals[order["orderId"]].append(deal)
+        order.update({
+            "left": "0",
+            "dealStock": str(Decimal(order["dealStock"]) + amount),
+            "dealMoney": str(Decimal(order["dealMoney"]) + deal_money),
+            "dealFee": str(Decimal(order["dealFee"]) + fee),
+        })
+        await self._publish(CONSTANTS.WHITEBIT_WS_PRIVATE_TRADES_CHANNEL, [
+            deal["id"], deal["time"], order["market"], order["orderId"], deal["price"], deal["amount"], deal["fee"],
+            order["clientOrderId"]])
+        await self._finish_order(order=order)
+
+    async def _finish_order(self, order: Dict[str, Any]):
+        base, quote = order["market"].split("_")
+        left = Decimal(order["left"])
+        if order["side"] == "buy":
+            self._frozen[quote] -= left * Decimal(order["price"])
+            self._available[quote] += left * Decimal(order["price"])
+        else:
+            self._frozen[base] -= left
+            self._available[base] += left
+        self._active_orders.pop(order["orderId"], None)
+        if Decimal(order["dealStock"]) > 0:
+            self._orders_history[order["market"]].append({
+                "id": order["orderId"], "clientOrderId": order["clientOrderId"], "ctime": order["timestamp"],
+                "ftime": time.time(), "side": order["side"], "amount": order["amount"], "price": order["price"],
+                "type": order["type"], "dealMoney": order["dealMoney"], "dealStock": order["dealStock"],
+                "dealFee": order["dealFee"]})
+        await self._publish_order_event(event_id=3, order=order)
+        await self._publish_balances(assets={base, quote})
+
+    def _best_prices(self, symbol: str):
+        bids, asks = self._book(symbol)
+        return Decimal(bids[0][0]), Decimal(asks[0][0])
+
+    def _book(self, symbol: str):
+        mid_price = self._mid_prices[symbol]
+        step = mid_price * Decimal("0.0001")
+        levels = range(self._config.book_levels)
+        bids = [[str(mid_price - step * (level + 1)), str(Decimal(level + 1))] for level in levels]
+        asks = [[str(mid_price + step * (level + 1)), str(Decimal(level + 1))] for level in levels]
+        return bids, asks
+
+    async def _market_updates_loop(self):
+        while True:
+            await asyncio.sleep(self._config.market_update_interval)
+            for symbol, mid_price in list(self._mid_prices.items()):
+                self._mid_prices[symbol] = mid_price * Decimal(str(1 + self._random.gauss(0, 0.0005)))
+                bids, asks = self._book(symbol)
+                await self._publish(CONSTANTS.WHITEBIT_WS_PUBLIC_BOOKS_CHANNEL, [
+                    True, {"timestamp": time.time(), "bids": bids, "asks": asks}, symbol], market=symbol)
+                trade = {"id": self._random.randint(1, 2 ** 31), "time": time.time(), "price": bids[0][0],
+                         "amount": "1", "type": self._random.choice(["buy", "sell"])}
+                await self._publish(CONSTANTS.WHITEBIT_WS_PUBLIC_TRADES_CHANNEL, [symbol, [trade]], market=symbol)
+                best_bid, best_ask = Decimal(bids[0][0]), Decimal(asks[0][0])
+                for order in [order for order in self._active_orders.values() if order["market"] == symbol]:
+                    if ((order["side"] == "buy" and Decimal(order["price"]) >= best_ask)
+                            or (order["side"] == "sell" and Decimal(order["price"]) <= best_bid)):
+                        await self._fill_order(order=order, fill_price=Decimal(order["price"]))
+
+    # WebSocket
+
+    async def _websocket_handler(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                message = msg.json()
+                method = message.get("method", "")
+                if method.endswith("_subscribe"):
+                    channel = method[:-len("_subscribe")] + "_update"
+                    self._subscriptions[channel].add(ws)
+                    if channel in (
+                        CONSTANTS.WHITEBIT_WS_PUBLIC_BOOKS_CHANNEL, CONSTANTS.WHITEBIT_WS_PUBLIC_TRADES_CHANNEL
+                    ):
+                        params = message.get("params", [])
+                        markets = params[:1] if channel == CONSTANTS.WHITEBIT_WS_PUBLIC_BOOKS_CHANNEL else params
+                        self._market_subscriptions[ws].update(markets)
+                await ws.send_json({"id": message.get("id"), "result": {"status": "success"}, "error": None})
+        finally:
+            for subscribers in self._subscriptions.values():
+                subscribers.discard(ws)
+            self._market_subscriptions.pop(ws, None)
+        return ws
+
+    async def _publish(self, channel: str, params: List[Any], market: Optional[str] = None):
+        for ws in list(self._subscriptions[channel]):
+            if market is not None and market not in self._market_subscriptions.get(ws, set()):
+                continue
+            if not ws.closed:
+                await ws.send_json({"id": None, "method": channel, "params": params})
+
+    async def _publish_order_event(self, event_id: int, order: Dict[str, Any]):
+        await self._publish(CONSTANTS.WHITEBIT_WS_PRIVATE_ORDERS_CHANNEL, [event_id, {
+            "id": order["orderId"], "market": order["market"], "type": 1, "side": 2 if order["side"] == "buy" else 1,
+            "ctime": order["timestamp"], "mtime": time.time(), "price": order["price"], "amount": order["amount"],
+            "left": order["left"], "deal_stock": order["dealStock"], "deal_money": order["dealMoney"],
+            "deal_fee": order["dealFee"], "client_order_id": order["clientOrderId"]}])
+
+    async def _publish_balances(self, assets: Set[str]):
+        await self._publish(CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL, [self._balances_message(assets=assets)])
+
+    def _balances_message(self, assets: Set[str]) -> Dict[str, Dict[str, str]]:
+        return {
+            asset: {"available": str(self._available[asset]), "freeze": str(self._frozen[asset])}
+            for asset in assets
+        }
+
+
+class SimulatorRequestError(Exception):
+    def __init__(self, status: int, response: Dict[str, Any]):
+        super().__init__(response.get("message"))
+        self.status = status
+        self.response = response
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Offline Whitebit REST and WebSocket simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=int, default=CONSTANTS.MAX_REQUESTS_LIMIT)
+    args = parser.parse_args()
+
+    simulator = WhitebitSimulator(config=WhitebitSimulatorConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+    ))
+    await simulator.start(host=args.host, port=args.port)
+    print(f"Whitebit simulator listening on http://{args.host}:{args.port}/ (ws://{args.host}:{args.port}/ws)")
+    try:
+        while True:
+            await asyncio.sleep(3600)
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,111 @@
+"""
+Measures the per message cost of processing Whitebit user stream messages in WhitebitExchange. Recorded payloads are
+decoded with the standard JSON decoder, as the WebSocket assistant does, queued in the user stream and consumed by the
+connector's own user stream listener, so the numbers include the dispatch, the _process_*_message handlers and the
+order tracker updates.
+
+Usage: python -m hummingbot.connector.exchange.whitebit.whitebit_stream_benchmark [--messages N]
+"""
+import argparse
+import asyncio
+import json
+import time
+from decimal import Decimal
+from typing import List
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.whitebit import whitebit_constants as CONSTANTS
+from hummingbot.connector.exchange.whitebit.whitebit_exchange import WhitebitExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+
+TRADING_PAIR = "BTC-USDT"
+EXCHANGE_TRADING_PAIR = "BTC_USDT"
+CLIENT_ORDER_ID = "HBOT-B1"
+EXCHANGE_ORDER_ID = 7425988844
+
+# Payloads recorded from the private channels. The deal id of the trades is replaced for each message, so every fill
+# goes through the whole handler instead of being dropped as a duplicate
+RECORDED_PAYLOADS = {
+    CONSTANTS.WHITEBIT_WS_PRIVATE_TRADES_CHANNEL: (
+        '{"id": null, "method": "deals_update", "params": [252104486, 1602770801.015587, "BTC_USDT", 7425988844, '
+        '"11399.24", "0.000001", "0.094112", "HBOT-B1"]}'
+    ),
+    CONSTANTS.WHITEBIT_WS_PRIVATE_ORDERS_CHANNEL: (
+        '{"id": null, "method": "ordersPending_update", "params": [2, {"id": 7425988844, "market": "BTC_USDT", '
+        '"type": 1, "side": 2, "ctime": 1602770801.015587, "mtime": 1602770801.015587, "price": "11399.24", '
+        '"amount": "1000", "left": "999.99", "deal_stock": "0.01", "deal_money": "113.99", "deal_fee": "0.094112", '
+        '"client_order_id": "HBOT-B1"}]}'
+    ),
+    CONSTANTS.WHITEBIT_WS_PRIVATE_BALANCE_CHANNEL: (
+        '{"id": null, "method": "balanceSpot_update", "params": [{"USDT": {"available": "1000.5", "freeze": "94.11"}, '
+        '"BTC": {"available": "0.5", "freeze": "0"}}]}'
+    ),
+}
+
+
+def _build_exchange() -> WhitebitExchange:
+    exchange = WhitebitExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        whitebit_api_key="",
+        whitebit_secret_key="",
+        trading_pairs=[TRADING_PAIR],
+        trading_required=False,
+    )
+    exchange._set_trading_pair_symbol_map(bidict({EXCHANGE_TRADING_PAIR: TRADING_PAIR}))
+    # The order is big enough to never be completely filled by the benchmark
+    exchange.start_tracking_order(
+        order_id=CLIENT_ORDER_ID,
+        exchange_order_id=str(EXCHANGE_ORDER_ID),
+        trading_pair=TRADING_PAIR,
+        trade_type=TradeType.BUY,
+        price=Decimal("11399.24"),
+        amount=Decimal("1000"),
+        order_type=OrderType.LIMIT,
+    )
+    return exchange
+
+
+def _raw_messages(channel: str, count: int) -> List[str]:
+    payload = RECORDED_PAYLOADS[channel]
+    if channel != CONSTANTS.WHITEBIT_WS_PRIVATE_TRADES_CHANNEL:
+        return [payload] * count
+    return [payload.replace("252104486", str(252104486 + i), 1) for i in range(count)]
+
+
+async def _measure(channel: str, count: int) -> float:
+    exchange = _build_exchange()
+    raw_messages = _raw_messages(channel=channel, count=count)
+    user_stream = exchange._user_stream_tracker.user_stream
+    listener = asyncio.ensure_future(exchange._user_stream_event_listener())
+    start_time = time.perf_counter()
+    for raw_message in raw_messages:
+        user_stream.put_nowait(json.loads(raw_message))
+    while not user_stream.empty():
+        await asyncio.sleep(0)
+    # The listener processes the last message before it waits on the empty queue again
+    await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start_time
+    listener.cancel()
+    if exchange._user_stream_failed_messages > 0:
+        raise RuntimeError(f"{exchange._user_stream_failed_messages} {channel} messages failed to be processed")
+    return elapsed / count
+
+
+async def _run(count: int):
+    for channel in RECORDED_PAYLOADS:
+        per_message = await _measure(channel=channel, count=count)
+        print(f"{channel:<24} {per_message * 1e6:8.2f} us/message")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000, help="number of messages processed for each channel")
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(_run(count=args.messages))
+
+
+if __name__ == "__main__":
+    main()
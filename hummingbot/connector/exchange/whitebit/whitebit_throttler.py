@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, List
+
+from hummingbot.connector.exchange.whitebit import whitebit_constants as CONSTANTS
+from hummingbot.connector.exchange.whitebit.whitebit_metrics import PHASE_THROTTLE, add_request_phase
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+
+
+class WhitebitRequestContext:
+    """
+    Wraps the throttler request context to measure the time each request waits for rate limit capacity
+    """
+
+    def __init__(self, context: Any, throttler: "WhitebitThrottler", limit_id: str):
+        self._context = context
+        self._throttler = throttler
+        self._limit_id = limit_id
+
+    async def acquire(self):
+        start_time = time.perf_counter()
+        await self._throttler.wait_for_reserved_capacity(limit_id=self._limit_id)
+        await self._context.acquire()
+        self._throttler.record_wait(limit_id=self._limit_id, wait_time=time.perf_counter() - start_time)
+
+    async def __aenter__(self):
+        await self.acquire()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._context.__aexit__(exc_type, exc_val, exc_tb)
+
+
+class WhitebitThrottler(AsyncThrottler):
+    """
+    Throttler that keeps, for each request priority class in CONSTANTS.REQUEST_PRIORITIES, the number of requests and
+    the total and maximum time they waited in the throttler
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_counts: Dict[str, int] = defaultdict(int)
+        self._wait_times: Dict[str, float] = defaultdict(float)
+        self._max_wait_times: Dict[str, float] = defaultdict(float)
+
+    @property
+    def wait_statistics(self) -> Dict[str, Dict[str, float]]:
+        return {
+            priority: {
+                "requests": count,
+                "total_wait": self._wait_times[priority],
+                "average_wait": self._wait_times[priority] / count,
+                "max_wait": self._max_wait_times[priority],
+            }
+            for priority, count in self._wait_counts.items()
+        }
+
+    def execute_task(self, limit_id: str) -> WhitebitRequestContext:
+        return WhitebitRequestContext(
+            context=super().execute_task(limit_id=limit_id), throttler=self, limit_id=limit_id
+        )
+
+    async def wait_for_reserved_capacity(self, limit_id: str):
+        """
+        Waits until the global limit has more capacity left than the capacity reserved for the more urgent classes
+        (CONSTANTS.REQUEST_PRIORITY_RESERVED_CAPACITY)
+        """
+        priority = CONSTANTS.REQUEST_PRIORITIES.get(limit_id, CONSTANTS.REQUEST_PRIORITY_OTHER)
+        reserved_capacity = CONSTANTS.REQUEST_PRIORITY_RESERVED_CAPACITY.get(priority, 0)
+        if reserved_capacity == 0 or not self._is_linked_to_global_limit(limit_id=limit_id):
+            return
+        global_limit = self._id_to_limit_map[CONSTANTS.WHITEBIT_GENERAL_RATE_LIMIT]
+        while True:
+            now = time.time()
+            task_logs = self._window_task_logs(limit_id=CONSTANTS.WHITEBIT_GENERAL_RATE_LIMIT, now=now)
+            available_capacity = global_limit.limit - sum(task.weight for task in task_logs)
+            if available_capacity > reserved_capacity:
+                return
+            # Capacity is only given back when the logged requests leave the time window, so the wait lasts until
+            # enough of the oldest ones expire instead of polling at a fixed interval
+            missing_capacity = reserved_capacity + 1 - available_capacity
+            released_capacity = 0
+            release_time = now
+            for task in sorted(task_logs, key=lambda task_log: task_log.timestamp):
+                released_capacity += task.weight
+                release_time = task.timestamp + global_limit.time_interval
+                if released_capacity >= missing_capacity:
+                    break
+            await asyncio.sleep(max(release_time - now, 0.0) + self._retry_interval)
+
+    def _is_linked_to_global_limit(self, limit_id: str) -> bool:
+        rate_limit = self._id_to_limit_map.get(limit_id)
+        return rate_limit is not None and any(
+            linked_limit.limit_id == CONSTANTS.WHITEBIT_GENERAL_RATE_LIMIT for linked_limit in rate_limit.linked_limits
+        )
+
+    def record_wait(self, limit_id: str, wait_time: float):
+        priority = CONSTANTS.REQUEST_PRIORITIES.get(limit_id, CONSTANTS.REQUEST_PRIORITY_OTHER)
+        self._wait_counts[priority] += 1
+        self._wait_times[priority] += wait_time
+        self._max_wait_times[priority] = max(self._max_wait_times[priority], wait_time)
+        add_request_phase(phase=PHASE_THROTTLE, duration=wait_time)
+
+    def available_capacity(self, limit_id: str) -> int:
+        """
+        Returns how many requests with weight 1 the limit still accepts in its current time window
+        """
+        rate_limit = self._id_to_limit_map[limit_id]
+        task_logs = self._window_task_logs(limit_id=limit_id, now=time.time())
+        return rate_limit.limit - sum(task.weight for task in task_logs)
+
+    def _window_task_logs(self, limit_id: str, now: float) -> List[Any]:
+        rate_limit = self._id_to_limit_map[limit_id]
+        return [
+            task for task in self._task_logs
+            if task.rate_limit.limit_id == limit_id and now - task.timestamp <= rate_limit.time_interval
+        ]
@@ -0,0 +1,36 @@
+import time
+
+from hummingbot.connector.exchange.whitebit.whitebit_api_user_stream_data_source import WhitebitAPIUserStreamDataSource
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+
+
+class WhitebitTrackedAPIUserStreamDataSource(WhitebitAPIUserStreamDataSource):
+    """
+    User stream data source that records when the private channels were last (re)subscribed. The subscription
+    confirmations are consumed by the data source and never reach the connector, so the connector reads the time of the
+    last subscription from here to know when events could have been lost during a reconnection
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_subscription_timestamp = 0.0
+        self._subscriptions_count = 0
+
+    @property
+    def last_subscription_timestamp(self) -> float:
+        """
+        Returns the time of the last subscription to the private channels (0 if the stream never connected)
+        """
+        return self._last_subscription_timestamp
+
+    @property
+    def subscriptions_count(self) -> int:
+        """
+        Returns the number of times the private channels were subscribed, the first connection included
+        """
+        return self._subscriptions_count
+
+    async def _subscribe_channels(self, websocket_assistant: WSAssistant):
+        await super()._subscribe_channels(websocket_assistant=websocket_assistant)
+        self._last_subscription_timestamp = time.time()
+        self._subscriptions_count += 1
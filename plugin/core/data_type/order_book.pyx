@@ -1,5 +1,6 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+import asyncio
 import bisect
 import logging
 import time
@@ -34,6 +35,8 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+# Depth key of the full snapshot in the snapshot cache
+FULL_SNAPSHOT_DEPTH = -1
 
 
 cdef class OrderBook(PubSub):
@@ -56,16 +59,23 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._snapshot_cache = {}
+        self._snapshot_cache_hits = 0
+        self._snapshot_cache_misses = 0
+        self._update_coalescing_interval = -1
+        self._update_notification_scheduled = False
+        self._pending_update_id = 0
+        self._last_notified_update_id = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        self.c_apply_diff_entries(bids, asks)
+        self.c_finalize_diffs(update_id)
+
+    cdef c_apply_diff_entries(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks):
         cdef:
             set[OrderBookEntry].iterator bid_book_end = self._bid_book.end()
             set[OrderBookEntry].iterator ask_book_end = self._ask_book.end()
-            set[OrderBookEntry].reverse_iterator bid_iterator
-            set[OrderBookEntry].iterator ask_iterator
             set[OrderBookEntry].iterator result
-            OrderBookEntry top_bid
-            OrderBookEntry top_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -81,6 +91,13 @@ cdef class OrderBook(PubSub):
             if ask.getAmount() > 0:
                 self._ask_book.insert(ask)
 
+    cdef c_finalize_diffs(self, int64_t update_id):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_iterator
+            set[OrderBookEntry].iterator ask_iterator
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+
         # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: see OrderBookEntry.cpp
         truncateOverlapEntries(self._bid_book, self._ask_book, self._dex)
 
@@ -96,7 +113,8 @@ cdef class OrderBook(PubSub):
 
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
-        self.c_trigger_event(self.ORDER_BOOK_DATA_SOURCE_UPDATE_EVENT_TAG, Null) #ADD
+        self._snapshot_cache.clear()
+        self.c_notify_data_source_update(update_id) #ADD
 
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -137,7 +155,49 @@ cdef class OrderBook(PubSub):
 
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
-        self.c_trigger_event(self.ORDER_BOOK_DATA_SOURCE_UPDATE_EVENT_TAG, Null) #ADD
+        self._snapshot_cache.clear()
+        self.c_notify_data_source_update(update_id) #ADD
+
+    def set_update_coalescing(self, interval: Optional[float]):
+        """
+        Configures the order book data source update notifications. With None (the default) subscribers are notified
+        after every diff and snapshot. With 0 they are notified at most once per event loop iteration, and with a
+        positive interval at most once every `interval` seconds. Coalesced notifications are sent when the latest
+        update is still pending (see pending_update_id).
+        """
+        self._update_coalescing_interval = -1 if interval is None else max(interval, 0)
+
+    @property
+    def pending_update_id(self) -> Optional[int]:
+        return self._pending_update_id if self._update_notification_scheduled else None
+
+    @property
+    def last_notified_update_id(self) -> int:
+        return self._last_notified_update_id
+
+    cdef c_notify_data_source_update(self, int64_t update_id):
+        self._pending_update_id = update_id
+        if self._update_coalescing_interval < 0:
+            self._flush_data_source_update()
+            return
+        if self._update_notification_scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without a running loop nothing would send the notification later
+            self._flush_data_source_update()
+            return
+        self._update_notification_scheduled = True
+        if self._update_coalescing_interval == 0:
+            loop.call_soon(self._flush_data_source_update)
+        else:
+            loop.call_later(self._update_coalescing_interval, self._flush_data_source_update)
+
+    def _flush_data_source_update(self):
+        self._update_notification_scheduled = False
+        self._last_notified_update_id = self._pending_update_id
+        self.c_trigger_event(self.ORDER_BOOK_DATA_SOURCE_UPDATE_EVENT_TAG, None) #ADD
 
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
@@ -172,13 +232,82 @@ cdef class OrderBook(PubSub):
     def last_diff_uid(self) -> int:
         return self._last_diff_uid
 
+    @property
+    def snapshot_cache_stats(self) -> Dict[str, int]:
+        return {"hits": self._snapshot_cache_hits, "misses": self._snapshot_cache_misses}
+
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
-        return bids_df, asks_df
+        """
+        The data frames are built once per book change and cached. Each caller gets its own copy, so callers can
+        still modify the result.
+        """
+        cached_result = self.c_get_cached_snapshot(FULL_SNAPSHOT_DEPTH)
+        if cached_result is None:
+            bids_array = np.array(list(self.bid_entries()), dtype=np.float64).reshape(-1, len(OrderBookRow._fields))
+            asks_array = np.array(list(self.ask_entries()), dtype=np.float64).reshape(-1, len(OrderBookRow._fields))
+            bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, copy=False)
+            asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, copy=False)
+            cached_result = self.c_cache_snapshot(FULL_SNAPSHOT_DEPTH, (bids_df, asks_df))
+        bids_df, asks_df = cached_result
+        return bids_df.copy(), asks_df.copy()
+
+    def clear_snapshot_cache(self):
+        """
+        Drops the cached snapshot and top_levels results. The book is not changed and no event is sent.
+        """
+        self._snapshot_cache.clear()
+
+    cdef object c_get_cached_snapshot(self, int depth):
+        # The cache is cleared each time the book changes, the update ids in the key only guard against stale entries
+        result = self._snapshot_cache.get((self._snapshot_uid, self._last_diff_uid, depth))
+        if result is None:
+            self._snapshot_cache_misses += 1
+        else:
+            self._snapshot_cache_hits += 1
+        return result
+
+    cdef object c_cache_snapshot(self, int depth, object result):
+        self._snapshot_cache[(self._snapshot_uid, self._last_diff_uid, depth)] = result
+        return result
+
+    def top_levels(self, int depth) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the best `depth` bid and ask levels as two float64 arrays with the [price, amount] columns, best level
+        first. A side with fewer levels returns fewer rows. Unlike snapshot, no row objects or DataFrames are built.
+        The arrays are cached until the book changes and are read-only.
+        """
+        if depth < 0:
+            depth = 0
+        cached_result = self.c_get_cached_snapshot(depth)
+        if cached_result is not None:
+            return cached_result
+        return self.c_cache_snapshot(depth, self.c_top_levels(depth))
+
+    cdef tuple c_top_levels(self, size_t levels):
+        cdef:
+            size_t bid_count = min(levels, self._bid_book.size())
+            size_t ask_count = min(levels, self._ask_book.size())
+            np.ndarray[np.float64_t, ndim=2] bids = np.empty((bid_count, 2), dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=2] asks = np.empty((ask_count, 2), dtype=np.float64)
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            OrderBookEntry entry
+            size_t i
+
+        for i in range(bid_count):
+            entry = deref(bid_iterator)
+            bids[i, 0] = entry.getPrice()
+            bids[i, 1] = entry.getAmount()
+            inc(bid_iterator)
+        for i in range(ask_count):
+            entry = deref(ask_iterator)
+            asks[i, 0] = entry.getPrice()
+            asks[i, 1] = entry.getAmount()
+            inc(ask_iterator)
+        bids.flags.writeable = False
+        asks.flags.writeable = False
+        return bids, asks
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
@@ -190,6 +319,28 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_diffs(cpp_bids, cpp_asks, update_id)
 
+    def apply_diffs_batch(self, messages: List[OrderBookMessage]):
+        """
+        Applies several diff messages in update id order (messages with the same id keep their order), then resolves
+        the overlapping entries, records the best prices and notifies the update once, for the last update id.
+        """
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+            int64_t last_update_id = self._last_diff_uid
+        if len(messages) == 0:
+            return
+        for message in sorted(messages, key=lambda diff: diff.update_id):
+            cpp_bids.clear()
+            cpp_asks.clear()
+            for row in message.bids:
+                cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            for row in message.asks:
+                cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+            self.c_apply_diff_entries(cpp_bids, cpp_asks)
+            last_update_id = message.update_id
+        self.c_finalize_diffs(last_update_id)
+
     def apply_snapshot(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -238,6 +389,16 @@ cdef class OrderBook(PubSub):
             last_update_id = max(last_update_id, <int64_t>row[2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
+    def apply_numpy_diffs_batch(self, bids_array: np.ndarray, asks_array: np.ndarray):
+        """
+        Applies the rows of several diff messages concatenated in two arrays with the [price, amount, update_id]
+        columns. The rows are applied in update id order (rows with the same id keep their order) and the book is
+        finalized and notified once.
+        """
+        bids_array = np.ascontiguousarray(bids_array[np.argsort(bids_array[:, 2], kind="stable")], dtype=np.float64)
+        asks_array = np.ascontiguousarray(asks_array[np.argsort(asks_array[:, 2], kind="stable")], dtype=np.float64)
+        self.c_apply_numpy_diffs(bids_array, asks_array)
+
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id].
@@ -373,6 +534,66 @@ cdef class OrderBook(PubSub):
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
+    def get_vwap_for_volumes(self, bint is_buy, volumes) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the VWAP and the filled amount of each of the volumes, in the order they were given, walking the asks
+        (is_buy) or the bids once. When the book side is shallower than a volume, its VWAP is the one of the amount
+        that could be filled (NaN if the side is empty).
+        """
+        cdef:
+            np.ndarray[np.float64_t, ndim=1] targets = np.ascontiguousarray(volumes, dtype=np.float64).reshape(-1)
+            np.ndarray[np.intp_t, ndim=1] order = np.argsort(targets, kind="stable")
+            np.ndarray[np.float64_t, ndim=1] vwaps = np.empty(targets.shape[0], dtype=np.float64)
+            np.ndarray[np.float64_t, ndim=1] filled = np.empty(targets.shape[0], dtype=np.float64)
+            Py_ssize_t count = targets.shape[0]
+            Py_ssize_t k = 0
+            Py_ssize_t index
+            double total_cost = 0
+            double total_volume = 0
+            double price
+            double amount
+            double target
+            set[OrderBookEntry].iterator ask_iterator = self._ask_book.begin()
+            set[OrderBookEntry].reverse_iterator bid_iterator = self._bid_book.rbegin()
+            OrderBookEntry entry
+
+        if is_buy:
+            while k < count and ask_iterator != self._ask_book.end():
+                entry = deref(ask_iterator)
+                price = entry.getPrice()
+                amount = entry.getAmount()
+                while k < count and total_volume + amount >= targets[order[k]]:
+                    index = order[k]
+                    target = targets[index]
+                    vwaps[index] = (total_cost + (target - total_volume) * price) / target if target > 0 else price
+                    filled[index] = target
+                    k += 1
+                total_cost += price * amount
+                total_volume += amount
+                inc(ask_iterator)
+        else:
+            while k < count and bid_iterator != self._bid_book.rend():
+                entry = deref(bid_iterator)
+                price = entry.getPrice()
+                amount = entry.getAmount()
+                while k < count and total_volume + amount >= targets[order[k]]:
+                    index = order[k]
+                    target = targets[index]
+                    vwaps[index] = (total_cost + (target - total_volume) * price) / target if target > 0 else price
+                    filled[index] = target
+                    k += 1
+                total_cost += price * amount
+                total_volume += amount
+                inc(bid_iterator)
+
+        # Volumes larger than the book side
+        while k < count:
+            index = order[k]
+            vwaps[index] = total_cost / total_volume if total_volume > 0 else NaN
+            filled[index] = total_volume
+            k += 1
+        return vwaps, filled
+
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume):
         cdef:
             double cumulative_volume = 0
@@ -0,0 +1,131 @@
+"""
+Benchmarks of the OrderBook read paths used by the strategy components.
+
+Usage: python -m hummingbot.core.data_type.order_book_benchmark [--levels N] [--depth N] [--iterations N]
+"""
+import argparse
+import time
+from typing import Callable
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+def build_order_book(levels: int) -> OrderBook:
+    order_book = OrderBook()
+    bid_prices = 100.0 - np.arange(1, levels + 1) * 0.01
+    ask_prices = 100.0 + np.arange(1, levels + 1) * 0.01
+    amounts = np.random.uniform(0.1, 10.0, size=levels)
+    update_ids = np.ones(levels)
+    order_book.apply_numpy_snapshot(
+        np.column_stack((bid_prices, amounts, update_ids)),
+        np.column_stack((ask_prices, amounts, update_ids)),
+    )
+    return order_book
+
+
+def measure(function: Callable, iterations: int) -> float:
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start_time) / iterations
+
+
+def benchmark_top_levels(order_book: OrderBook, depth: int, iterations: int):
+    def snapshot_top_levels():
+        order_book.clear_snapshot_cache()
+        bids_df, asks_df = order_book.snapshot
+        return (
+            bids_df.loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+            asks_df.loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+        )
+
+    def numpy_top_levels():
+        order_book.clear_snapshot_cache()
+        bids, asks = order_book.top_levels(depth)
+        return bids.tolist(), asks.tolist()
+
+    snapshot_time = measure(snapshot_top_levels, iterations)
+    top_levels_time = measure(numpy_top_levels, iterations)
+    print(f"top {depth} levels: snapshot {snapshot_time * 1e6:.1f} us, top_levels {top_levels_time * 1e6:.1f} us "
+          f"(x{snapshot_time / top_levels_time:.1f})")
+
+
+def benchmark_snapshot_cache(order_book: OrderBook, iterations: int):
+    def uncached_snapshot():
+        order_book.clear_snapshot_cache()
+        return order_book.snapshot
+
+    def cached_snapshot():
+        return order_book.snapshot
+
+    uncached_time = measure(uncached_snapshot, iterations)
+    cached_time = measure(cached_snapshot, iterations)
+    print(f"snapshot: uncached {uncached_time * 1e6:.1f} us, cached {cached_time * 1e6:.1f} us "
+          f"(cache stats {order_book.snapshot_cache_stats})")
+
+
+def benchmark_batch_diffs(levels: int, messages: int, rows_per_message: int = 10):
+    rng = np.random.default_rng(1)
+    diffs = []
+    for update_id in range(2, messages + 2):
+        bid_prices = 100.0 - rng.integers(1, levels + 1, size=rows_per_message) * 0.01
+        ask_prices = 100.0 + rng.integers(1, levels + 1, size=rows_per_message) * 0.01
+        amounts = rng.uniform(0.0, 10.0, size=rows_per_message)
+        update_ids = np.full(rows_per_message, update_id, dtype=np.float64)
+        diffs.append((
+            np.column_stack((bid_prices, amounts, update_ids)),
+            np.column_stack((ask_prices, amounts, update_ids)),
+        ))
+
+    order_book = build_order_book(levels=levels)
+    start_time = time.perf_counter()
+    for bids_array, asks_array in diffs:
+        order_book.apply_numpy_diffs(bids_array, asks_array)
+    one_by_one_time = time.perf_counter() - start_time
+
+    batch_order_book = build_order_book(levels=levels)
+    start_time = time.perf_counter()
+    batch_order_book.apply_numpy_diffs_batch(
+        np.concatenate([bids_array for bids_array, _ in diffs]),
+        np.concatenate([asks_array for _, asks_array in diffs]),
+    )
+    batch_time = time.perf_counter() - start_time
+    print(f"{messages} diff messages: one by one {one_by_one_time * 1e3:.2f} ms, batch {batch_time * 1e3:.2f} ms "
+          f"(x{one_by_one_time / batch_time:.1f})")
+
+
+def benchmark_vwap_for_volumes(order_book: OrderBook, volumes: int, iterations: int):
+    sizes = [0.5 * (level + 1) for level in range(volumes)]
+
+    def vwap_per_volume():
+        return [order_book.get_vwap_for_volume(True, size) for size in sizes]
+
+    def vwap_for_volumes():
+        return order_book.get_vwap_for_volumes(True, sizes)
+
+    per_volume_time = measure(vwap_per_volume, iterations)
+    batch_time = measure(vwap_for_volumes, iterations)
+    print(f"vwap for {volumes} volumes: per volume {per_volume_time * 1e6:.1f} us, "
+          f"get_vwap_for_volumes {batch_time * 1e6:.1f} us (x{per_volume_time / batch_time:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OrderBook benchmarks")
+    parser.add_argument("--levels", type=int, default=1000, help="levels on each side of the book")
+    parser.add_argument("--depth", type=int, default=50, help="levels read by the queries")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--messages", type=int, default=1000, help="diff messages applied by the batch benchmark")
+    parser.add_argument("--volumes", type=int, default=10, help="volumes priced by the VWAP benchmark")
+    args = parser.parse_args()
+
+    order_book = build_order_book(levels=args.levels)
+    benchmark_top_levels(order_book=order_book, depth=args.depth, iterations=args.iterations)
+    benchmark_snapshot_cache(order_book=order_book, iterations=args.iterations)
+    benchmark_batch_diffs(levels=args.levels, messages=args.messages)
+    benchmark_vwap_for_volumes(order_book=order_book, volumes=args.volumes, iterations=args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -124,50 +124,25 @@ class MarketsMonitor(OrderBookComponent):
 
 
 
-    def on_order_book_change(self, order_book_snapshot, connector_name: str, trading_pair: str):
+    def on_order_book_change(self, order_book, connector_name: str, trading_pair: str):
         self.logger().warning(f"on_order_book_change connector_name={connector_name}")
-        self.calculate_taker_prices(order_book_snapshot, connector_name, trading_pair, TradeType.SELL);
-        self.calculate_taker_prices(order_book_snapshot, connector_name, trading_pair, TradeType.BUY);
-
-    def calculate_taker_prices(self, order_book_snapshot, connector_exchange: str, connector_pair: str, trade_type: TradeType):
-        depth=50
-        order_book={
-            "bids": order_book_snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": order_book_snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-        }
-        #self.logger().warning(f"order_book: {json.dumps(order_book)}")
-        
+        self.calculate_taker_prices(order_book, connector_name, trading_pair, TradeType.SELL);
+        self.calculate_taker_prices(order_book, connector_name, trading_pair, TradeType.BUY);
+
+    # VWAP всех объемов считается за один проход по книге (OrderBook.get_vwap_for_volumes)
+    def calculate_taker_prices(self, order_book, connector_exchange: str, connector_pair: str, trade_type: TradeType):
         position_size = self.strategy.order_amount
         positions_count = self.strategy.n_levels
-        volumes = [Decimal(position_size) for _ in range(positions_count)]
-
-        prices = []
+        volumes = [float(position_size) for _ in range(positions_count)]
 
-        for volume in volumes:
-            total_volume = Decimal("0")
-            weighted_price = Decimal("0")
-            #orders = order_book_snapshot[1] if trade_type == TradeType.BUY else order_book_snapshot[0]
-            orders = order_book['asks'] if trade_type == TradeType.BUY else order_book['bids']
+        vwaps, filled = order_book.get_vwap_for_volumes(trade_type == TradeType.BUY, volumes)
 
-            for order in orders:
-                order_price = order[0]
-                order_volume = order[1]
-                available_volume = Decimal(order_volume)
-                required_volume = volume - total_volume
-
-                if available_volume > required_volume:
-                    available_volume = required_volume
-
-                weighted_price += Decimal(order_price) * available_volume
-                total_volume += available_volume
-
-                if total_volume >= volume:
-                    break
-
-            if total_volume == 0:
+        prices = []
+        for vwap, filled_volume in zip(vwaps, filled):
+            if filled_volume == 0:
                 prices.append(Decimal("0"))
             else:
-                prices.append(weighted_price / total_volume)
+                prices.append(Decimal(str(vwap)))
 
         self.taker_prices[trade_type] = prices
 
@@ -177,8 +152,7 @@ class MarketsMonitor(OrderBookComponent):
 
     def get_taker_prices(self,exchange,trading_pair) -> Decimal:
         order_book = self.connectors[exchange].get_order_book(trading_pair)
-        order_book_snapshot = order_book.snapshot
-        self.on_order_book_change(order_book_snapshot,exchange,trading_pair)
+        self.on_order_book_change(order_book,exchange,trading_pair)
         return self.taker_prices
 
     '''        
@@ -196,13 +170,9 @@ class MarketsMonitor(OrderBookComponent):
     # Profiler
     def get_order_book_diff_dict(self, exchange1: str, exchange2: str, trading_pair: str, depth: int = 50):
         order_book1 = self.connectors[exchange1].get_order_book(trading_pair)
-        snapshot1 = order_book1.snapshot
-        bids1=snapshot1[0].loc[:(depth - 1), ["price", "amount"]].values.tolist()
-        asks1=snapshot1[1].loc[:(depth - 1), ["price", "amount"]].values.tolist()
+        bids1, asks1 = order_book1.top_levels(depth)
         order_book2 = self.connectors[exchange2].get_order_book(trading_pair)
-        snapshot2 = order_book2.snapshot
-        bids2=snapshot2[0].loc[:(depth - 1), ["price", "amount"]].values.tolist()
-        asks2=snapshot2[1].loc[:(depth - 1), ["price", "amount"]].values.tolist()
+        bids2, asks2 = order_book2.top_levels(depth)
 
         diff1=100*(bids1[0][0]-asks2[0][0]) / bids1[0][0];
         diff2=100*(bids2[0][0]-asks1[0][0]) / bids2[0][0];
@@ -33,6 +33,11 @@ class OrderBookComponent:
     
 
     depth = int(os.getenv("DEPTH", 50))
+    # Интервал объединения уведомлений об обновлении книги (0 - не чаще одного раза за итерацию event loop).
+    # По умолчанию выключено: настройка действует на всю книгу, то есть и на других подписчиков этой книги
+    order_book_update_coalescing = (
+        float(os.getenv("ORDER_BOOK_UPDATE_COALESCING")) if os.getenv("ORDER_BOOK_UPDATE_COALESCING") else None
+    )
     subscribed_to_order_book_trade_event: bool = False
 
 
@@ -94,11 +99,11 @@ class OrderBookComponent:
 
     def get_order_book_dict(self, exchange: str, trading_pair: str, depth: int = 50):
         order_book = self.connectors[exchange].get_order_book(trading_pair)
-        snapshot = order_book.snapshot
+        bids, asks = order_book.top_levels(depth)
         return {
             "ts": self.current_timestamp,
-            "bids": snapshot[0].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
-            "asks": snapshot[1].loc[:(depth - 1), ["price", "amount"]].values.tolist(),
+            "bids": bids.tolist(),
+            "asks": asks.tolist(),
         }
 
 
@@ -140,6 +145,8 @@ class OrderBookComponent:
                 self.logger().warning(f"orderbook")
                 order_book.add_listener(OrderBookEvent.TradeEvent, self.order_book_trade_event)
                 order_book.add_listener(OrderBookEvent.OrderBookDataSourceUpdateEvent, self.order_book_data_source_update_event)
+                if self.order_book_update_coalescing is not None:
+                    order_book.set_update_coalescing(self.order_book_update_coalescing)
 
                 #order_book.add_listener(OrderBookDataSourceEvent.TRADE_EVENT, self.order_book_data_source_update_event)
                 #order_book.add_listener(OrderBookDataSourceEvent.SNAPSHOT_EVENT, self.order_book_data_source_update_event)
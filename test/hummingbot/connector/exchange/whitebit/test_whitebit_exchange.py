@@ -0,0 +1,104 @@
+import unittest
+from decimal import Decimal
+from typing import Any, List
+
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.whitebit.whitebit_exchange import WhitebitExchange
+from hummingbot.core.data_type.common import OrderType, TradeType
+
+
+class WhitebitExchangeTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.base_asset = "COINALPHA"
+        cls.quote_asset = "HBOT"
+        cls.trading_pair = f"{cls.base_asset}-{cls.quote_asset}"
+        cls.exchange_trading_pair = f"{cls.base_asset}_{cls.quote_asset}"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.exchange = WhitebitExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            whitebit_api_key="someKey",
+            whitebit_secret_key="someSecret",
+            trading_pairs=[self.trading_pair],
+        )
+        self.exchange._set_trading_pair_symbol_map(bidict({self.exchange_trading_pair: self.trading_pair}))
+
+    def _start_tracking_order(self, client_order_id: str, exchange_order_id: str, trade_type: TradeType):
+        self.exchange.start_tracking_order(
+            order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=self.trading_pair,
+            trade_type=trade_type,
+            price=Decimal("10"),
+            amount=Decimal("2"),
+            order_type=OrderType.LIMIT,
+        )
+
+    def _deal_params(self, deal_id: int, exchange_order_id: str, client_order_id: str) -> List[Any]:
+        # deals_update params: deal id, time, market, order id, price, amount, fee, client order id
+        return [
+            deal_id, 1663923100.0, self.exchange_trading_pair, exchange_order_id, "10", "1", "0.01", client_order_id
+        ]
+
+    def test_fill_received_twice_for_the_same_order_is_applied_once(self):
+        self._start_tracking_order(client_order_id="OID1", exchange_order_id="1001", trade_type=TradeType.BUY)
+
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1001", client_order_id="OID1")
+        )
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1001", client_order_id="OID1")
+        )
+
+        self.assertEqual(Decimal("1"), self.exchange.in_flight_orders["OID1"].executed_amount_base)
+
+    def test_self_match_fill_is_applied_to_both_orders_sharing_the_deal_id(self):
+        self._start_tracking_order(client_order_id="OID1", exchange_order_id="1001", trade_type=TradeType.BUY)
+        self._start_tracking_order(client_order_id="OID2", exchange_order_id="1002", trade_type=TradeType.SELL)
+
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1001", client_order_id="OID1")
+        )
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1002", client_order_id="OID2")
+        )
+
+        self.assertEqual(Decimal("1"), self.exchange.in_flight_orders["OID1"].executed_amount_base)
+        self.assertEqual(Decimal("1"), self.exchange.in_flight_orders["OID2"].executed_amount_base)
+
+    def test_stream_fill_is_projected_in_available_balance_before_the_balance_update(self):
+        self.exchange._account_balances[self.quote_asset] = Decimal("1000")
+        self.exchange._account_available_balances[self.quote_asset] = Decimal("1000")
+        self._start_tracking_order(client_order_id="OID1", exchange_order_id="1001", trade_type=TradeType.BUY)
+
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1001", client_order_id="OID1")
+        )
+
+        # 1 COINALPHA bought at 10 HBOT with a fee of 0.01 HBOT, not yet reported by the balance channel
+        self.assertEqual(Decimal("989.99"), self.exchange.get_available_balance(self.quote_asset))
+        self.assertEqual(Decimal("1"), self.exchange.get_available_balance(self.base_asset))
+
+    def test_balance_update_received_after_the_fill_replaces_its_projection(self):
+        self.exchange._account_balances[self.quote_asset] = Decimal("1000")
+        self.exchange._account_available_balances[self.quote_asset] = Decimal("1000")
+        self._start_tracking_order(client_order_id="OID1", exchange_order_id="1001", trade_type=TradeType.BUY)
+        self.exchange._process_trade_message(
+            self._deal_params(deal_id=5001, exchange_order_id="1001", client_order_id="OID1")
+        )
+
+        self.exchange._process_balance_message([
+            {
+                self.base_asset: {"available": "1", "freeze": "0"},
+                self.quote_asset: {"available": "989.99", "freeze": "0"},
+            }
+        ])
+
+        self.assertEqual(Decimal("989.99"), self.exchange.get_available_balance(self.quote_asset))
+        self.assertEqual(Decimal("1"), self.exchange.get_available_balance(self.base_asset))
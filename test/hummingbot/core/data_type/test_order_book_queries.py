@@ -0,0 +1,154 @@
+import math
+import unittest
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.events import OrderBookEvent
+
+
+class _UpdateListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.notifications = 0
+
+    def __call__(self, arg):
+        self.notifications += 1
+
+
+class OrderBookQueriesTests(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = OrderBook()
+        # Bids 99, 98, 97 and asks 101, 102, 103 with amounts 1, 2, 3 from the best level
+        self.order_book.apply_numpy_snapshot(
+            np.array([[99.0, 1.0, 1], [98.0, 2.0, 1], [97.0, 3.0, 1]]),
+            np.array([[101.0, 1.0, 1], [102.0, 2.0, 1], [103.0, 3.0, 1]]),
+        )
+
+    def _diff_message(self, update_id: int, bids: List[List[float]], asks: List[List[float]]) -> OrderBookMessage:
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT", "update_id": update_id, "bids": bids, "asks": asks},
+            timestamp=float(update_id),
+        )
+
+    def test_top_levels_returns_best_levels_first(self):
+        bids, asks = self.order_book.top_levels(2)
+
+        np.testing.assert_array_equal(np.array([[99.0, 1.0], [98.0, 2.0]]), bids)
+        np.testing.assert_array_equal(np.array([[101.0, 1.0], [102.0, 2.0]]), asks)
+        self.assertEqual(np.float64, bids.dtype)
+
+    def test_top_levels_deeper_than_the_book_returns_all_levels(self):
+        bids, asks = self.order_book.top_levels(50)
+
+        self.assertEqual((3, 2), bids.shape)
+        self.assertEqual((3, 2), asks.shape)
+
+    def test_top_levels_with_zero_depth_returns_empty_arrays(self):
+        bids, asks = self.order_book.top_levels(0)
+
+        self.assertEqual((0, 2), bids.shape)
+        self.assertEqual((0, 2), asks.shape)
+
+    def test_top_levels_follow_the_book_updates(self):
+        self.order_book.top_levels(2)
+
+        self.order_book.apply_numpy_diffs(np.array([[99.0, 0.0, 2], [99.5, 4.0, 2]]), np.empty((0, 3)))
+        bids, _ = self.order_book.top_levels(2)
+
+        np.testing.assert_array_equal(np.array([[99.5, 4.0], [98.0, 2.0]]), bids)
+
+    def test_get_vwap_for_volumes_matches_get_vwap_for_volume(self):
+        volumes = [2.5, 0.5, 4.0]
+
+        for is_buy in (True, False):
+            vwaps, filled = self.order_book.get_vwap_for_volumes(is_buy, volumes)
+            for volume, vwap, filled_amount in zip(volumes, vwaps, filled):
+                expected = self.order_book.get_vwap_for_volume(is_buy, volume)
+                self.assertAlmostEqual(expected.result_price, vwap)
+                self.assertAlmostEqual(volume, filled_amount)
+
+    def test_get_vwap_for_volumes_larger_than_the_book_side(self):
+        vwaps, filled = self.order_book.get_vwap_for_volumes(True, [10.0])
+
+        self.assertAlmostEqual((101.0 + 102.0 * 2 + 103.0 * 3) / 6, vwaps[0])
+        self.assertEqual(6.0, filled[0])
+
+    def test_get_vwap_for_volumes_on_an_empty_side(self):
+        order_book = OrderBook()
+
+        vwaps, filled = order_book.get_vwap_for_volumes(False, [1.0])
+
+        self.assertTrue(math.isnan(vwaps[0]))
+        self.assertEqual(0.0, filled[0])
+
+    def test_apply_diffs_batch_matches_applying_the_diffs_one_by_one(self):
+        messages = [
+            self._diff_message(update_id=3, bids=[[98.0, 0.0]], asks=[[101.0, 5.0]]),
+            self._diff_message(update_id=2, bids=[[98.0, 7.0], [99.5, 1.0]], asks=[[101.0, 4.0]]),
+        ]
+        one_by_one = OrderBook()
+        one_by_one.apply_numpy_snapshot(
+            np.array([[99.0, 1.0, 1], [98.0, 2.0, 1], [97.0, 3.0, 1]]),
+            np.array([[101.0, 1.0, 1], [102.0, 2.0, 1], [103.0, 3.0, 1]]),
+        )
+        for message in sorted(messages, key=lambda diff: diff.update_id):
+            one_by_one.apply_diffs(message.bids, message.asks, message.update_id)
+
+        self.order_book.apply_diffs_batch(messages)
+
+        self.assertEqual(list(one_by_one.bid_entries()), list(self.order_book.bid_entries()))
+        self.assertEqual(list(one_by_one.ask_entries()), list(self.order_book.ask_entries()))
+        self.assertEqual(3, self.order_book.last_diff_uid)
+        self.assertEqual(99.5, self.order_book.get_price(False))
+        self.assertEqual(101.0, self.order_book.get_price(True))
+
+    def test_apply_diffs_batch_notifies_the_update_once(self):
+        listener = _UpdateListener()
+        self.order_book.add_listener(OrderBookEvent.OrderBookDataSourceUpdateEvent, listener)
+
+        self.order_book.apply_diffs_batch([
+            self._diff_message(update_id=2, bids=[[98.0, 7.0]], asks=[]),
+            self._diff_message(update_id=3, bids=[[97.0, 0.0]], asks=[]),
+        ])
+
+        self.assertEqual(1, listener.notifications)
+
+    def test_apply_numpy_diffs_batch_applies_rows_in_update_id_order(self):
+        # The rows of update 3 come first in the arrays, but update 2 must not override them
+        bids = np.array([[98.0, 5.0, 3], [98.0, 9.0, 2], [99.0, 0.0, 2]])
+        asks = np.array([[102.0, 0.0, 3], [102.0, 8.0, 2]])
+
+        self.order_book.apply_numpy_diffs_batch(bids, asks)
+
+        bids_levels, asks_levels = self.order_book.top_levels(3)
+        np.testing.assert_array_equal(np.array([[98.0, 5.0], [97.0, 3.0]]), bids_levels)
+        np.testing.assert_array_equal(np.array([[101.0, 1.0], [103.0, 3.0]]), asks_levels)
+        self.assertEqual(3, self.order_book.last_diff_uid)
+
+    def test_snapshot_returns_a_copy_each_caller_can_modify(self):
+        bids_df, _ = self.order_book.snapshot
+        bids_df.loc[0, "amount"] = 100.0
+
+        bids_df, _ = self.order_book.snapshot
+
+        self.assertEqual(1.0, bids_df.loc[0, "amount"])
+        self.assertEqual(1, self.order_book.snapshot_cache_stats["misses"])
+
+    def test_clear_snapshot_cache_keeps_the_book_and_sends_no_event(self):
+        listener = _UpdateListener()
+        self.order_book.add_listener(OrderBookEvent.OrderBookDataSourceUpdateEvent, listener)
+        self.order_book.top_levels(2)
+
+        self.order_book.clear_snapshot_cache()
+        self.order_book.top_levels(2)
+
+        self.assertEqual(2, self.order_book.snapshot_cache_stats["misses"])
+        self.assertEqual(1, self.order_book.snapshot_uid)
+        self.assertEqual(0, self.order_book.last_diff_uid)
+        self.assertEqual(0, listener.notifications)